@@ -17,6 +17,7 @@ from ._bedspec import ReferenceSpan
 from ._bedspec import SimpleBed
 from ._bedspec import Stranded
 from ._reader import BedReader
+from ._table import BedTable
 from ._writer import BedWriter
 
 __all__ = [
@@ -39,5 +40,6 @@ __all__ = [
     "SimpleBed",
     "Stranded",
     "BedReader",
+    "BedTable",
     "BedWriter",
 ]
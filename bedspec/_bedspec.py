@@ -1,21 +1,25 @@
-import dataclasses
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Callable
 from collections.abc import Iterator
 from dataclasses import Field
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import fields
 from enum import Enum
 from enum import unique
+from functools import cache
 from typing import Any
 from typing import ClassVar
-from typing import Protocol
 from typing import TypeVar
 from typing import final
-from typing import runtime_checkable
+from typing import get_type_hints
 
+from typing_extensions import Protocol
 from typing_extensions import Self
+from typing_extensions import TypeGuard
 from typing_extensions import override
+from typing_extensions import runtime_checkable
 
 COMMENT_PREFIXES: set[str] = {"#", "browser", "track"}
 """The set of BED comment prefixes that this library supports."""
@@ -28,6 +32,8 @@ MISSING_FIELD: str = "."
 class DataclassInstance(Protocol):
     """A protocol for objects that are dataclass instances."""
 
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+
     __dataclass_fields__: ClassVar[dict[str, Field[Any]]]
 
 
@@ -43,10 +49,7 @@ class BedStrand(str, Enum):
 
     def opposite(self) -> "BedStrand":
         """Return the opposite BED strand."""
-        if self is BedStrand.Positive:
-            return BedStrand.Negative
-        else:
-            return BedStrand.Positive
+        return _OPPOSITE_STRANDS[self]
 
     @override
     def __str__(self) -> str:
@@ -54,10 +57,19 @@ class BedStrand(str, Enum):
         return self.value
 
 
+_OPPOSITE_STRANDS: dict[BedStrand, BedStrand] = {
+    BedStrand.Positive: BedStrand.Negative,
+    BedStrand.Negative: BedStrand.Positive,
+}
+"""A lookup table of each BED strand to its opposite strand."""
+
+
 @runtime_checkable
 class ReferenceSpan(Protocol):
     """A structural protocol for 0-based half-open objects located on a reference sequence."""
 
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+
     refname: str
     start: int
     end: int
@@ -67,6 +79,8 @@ class ReferenceSpan(Protocol):
 class Named(Protocol):
     """A structural protocol for a named BED type."""
 
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+
     name: str | None
 
 
@@ -74,12 +88,16 @@ class Named(Protocol):
 class Stranded(Protocol):
     """A structural protocol for stranded BED types."""
 
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+
     strand: BedStrand | None
 
 
 class BedLike(ABC, DataclassInstance):
     """An abstract base class for all types of BED records."""
 
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+
     @abstractmethod
     def territory(self) -> Iterator[ReferenceSpan]:
         """Return intervals that describe the territory of this BED record."""
@@ -89,18 +107,71 @@ BedType = TypeVar("BedType", bound=BedLike)
 """A type variable for any kind of BED record type."""
 
 
+@cache
+def field_types_of(bed_type: type[BedLike]) -> tuple[type[Any] | str | Any, ...]:
+    """Return the field types of a BED type with string annotations resolved to real types.
+
+    Field annotations are strings when a BED type is defined in a module that uses postponed
+    evaluation of annotations. They are resolved once per BED type, not once per record.
+    """
+    try:
+        hints: dict[str, Any] = get_type_hints(bed_type)
+    except NameError:
+        hints = {}
+    return tuple(hints.get(field.name, field.type) for field in fields(bed_type))
+
+
+def is_string_enum(field_type: type[Any] | str | Any) -> TypeGuard[type[Enum]]:
+    """Test if a field type is an enum whose members all have string values."""
+    return (
+        isinstance(field_type, type)
+        and issubclass(field_type, Enum)
+        and all(isinstance(member.value, str) for member in field_type)
+    )
+
+
+def _positional_constructor(bed_type: type[BedType]) -> Callable[..., BedType]:
+    """Generate a positional constructor of a linear BED type that skips keyword binding.
+
+    The constructor is for building the spans of BED records. It only checks the interval with
+    the same test and error as `SimpleBed.__post_init__`, since the other fields of a span come
+    from a BED record that has already been validated.
+    """
+    names: list[str] = [field.name for field in fields(bed_type)]
+    source: str = (
+        f"def build({', '.join(names)}):\n"
+        + "    if not 0 <= start < end:\n"
+        + "        raise ValueError('start must be greater than 0 and less than end!')\n"
+        + "    bed = new(bed_type)\n"
+        + "".join(f"    bed.{name} = {name}\n" for name in names)
+        + "    return bed\n"
+    )
+    namespace: dict[str, Any] = {"new": object.__new__, "bed_type": bed_type}
+    exec(source, namespace)
+    constructor: Callable[..., BedType] = namespace["build"]
+    return constructor
+
+
+def check_bed_type(bed_type: type[BedLike]) -> None:
+    """Raise an exception if a BED record type was not itself decorated with `@dataclass`.
+
+    This check runs once when a BED type is bound to a reader or writer, not per record. It must
+    look at the class namespace because subclasses inherit `__dataclass_fields__` from their
+    dataclass parents, so `dataclasses.is_dataclass()` is true even for undecorated subclasses.
+    """
+    if "__dataclass_fields__" not in vars(bed_type):
+        raise TypeError("You must annotate custom BED class definitions with @dataclass!")
+
+
 @dataclass
 class PointBed(BedLike, ABC):
     """An abstract class for a BED record that describes a 0-based 1-length point."""
 
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+
     refname: str
     start: int
 
-    def __init_subclass__(cls) -> None:
-        if not dataclasses.is_dataclass(cls):
-            raise TypeError("You must annotate custom BED class definitions with @dataclass!")
-        return super().__init_subclass__()
-
     @final
     def __len__(self) -> int:
         """The length of this record."""
@@ -116,18 +187,15 @@ class PointBed(BedLike, ABC):
 class SimpleBed(BedLike, ReferenceSpan, ABC):
     """An abstract class for a BED record that describes a contiguous linear interval."""
 
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+
     refname: str
     start: int
     end: int
 
-    def __init_subclass__(cls) -> None:
-        if not dataclasses.is_dataclass(cls):
-            raise TypeError("You must annotate custom BED class definitions with @dataclass!")
-        return super().__init_subclass__()
-
     def __post_init__(self) -> None:
         """Validate this linear BED record."""
-        if self.start >= self.end or self.start < 0:
+        if not 0 <= self.start < self.end:
             raise ValueError("start must be greater than 0 and less than end!")
 
     @final
@@ -138,13 +206,15 @@ class SimpleBed(BedLike, ReferenceSpan, ABC):
     @override
     def territory(self) -> Iterator[ReferenceSpan]:
         """Return the territory of a linear BED record which is just itself."""
-        yield self
+        return iter((self,))
 
 
 @dataclass
 class PairBed(BedLike, ABC):
     """An abstract base class for a BED record that describes a pair of linear linear intervals."""
 
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+
     refname1: str
     start1: int
     end1: int
@@ -152,46 +222,49 @@ class PairBed(BedLike, ABC):
     start2: int
     end2: int
 
-    def __init_subclass__(cls) -> None:
-        if not dataclasses.is_dataclass(cls):
-            raise TypeError("You must annotate custom BED class definitions with @dataclass!")
-        return super().__init_subclass__()
-
     def __post_init__(self) -> None:
         """Validate this pair of BED records."""
-        if self.start1 >= self.end1 or self.start1 < 0:
+        if not 0 <= self.start1 < self.end1:
             raise ValueError("start1 must be greater than 0 and less than end1!")
-        if self.start2 >= self.end2 or self.start2 < 0:
+        if not 0 <= self.start2 < self.end2:
             raise ValueError("start2 must be greater than 0 and less than end2!")
 
     @property
     def bed1(self) -> SimpleBed:
         """The first of the two intervals."""
-        return Bed3(refname=self.refname1, start=self.start1, end=self.end1)
+        return _positional_bed3(self.refname1, self.start1, self.end1)
 
     @property
     def bed2(self) -> SimpleBed:
         """The second of the two intervals."""
-        return Bed3(refname=self.refname2, start=self.start2, end=self.end2)
+        return _positional_bed3(self.refname2, self.start2, self.end2)
 
     @override
     def territory(self) -> Iterator[ReferenceSpan]:
         """Return the territory of this BED record which are two intervals."""
-        yield self.bed1
-        yield self.bed2
+        return iter((self.bed1, self.bed2))
 
 
-@dataclass(slots=True, unsafe_hash=True)
+@dataclass(slots=True, frozen=True)
 class BedColor:
-    """The color of a BED record in red, green, and blue color values."""
+    """The color of a BED record in red, green, and blue color values.
+
+    Colors are immutable so that BED readers can share one color among all records with the same
+    color. Use `dataclasses.replace()` to derive a different color.
+    """
 
     r: int
     g: int
     b: int
 
     def __post_init__(self) -> None:
-        """Validate that all color values are well-formatted."""
-        if any(value > 255 or value < 0 for value in (self.r, self.g, self.b)):
+        """Validate that all color values are well-formatted.
+
+        The bitwise union of the three values exceeds 255 if any value does, and is negative if any
+        value is negative, so all three values are range checked at once.
+        """
+        combined: int = self.r | self.g | self.b
+        if combined < 0 or combined > 0xFF:
             raise ValueError(f"RGB color values must be in the range [0, 255] but found: {self}")
 
     @classmethod
@@ -226,6 +299,9 @@ class Bed3(SimpleBed):
     end: int = field(kw_only=True)
 
 
+_positional_bed3: Callable[..., Bed3] = _positional_constructor(Bed3)
+
+
 @dataclass(slots=True, unsafe_hash=True)
 class Bed4(SimpleBed):
     """A BED4 record that describes a contiguous linear interval."""
@@ -259,6 +335,9 @@ class Bed6(SimpleBed, Named, Stranded):
     strand: BedStrand | None = field(kw_only=True)
 
 
+_positional_bed6: Callable[..., Bed6] = _positional_constructor(Bed6)
+
+
 @dataclass(slots=True, unsafe_hash=True)
 class Bed12(SimpleBed, Named, Stranded):
     """A BED12 record that describes a contiguous linear interval."""
@@ -295,7 +374,7 @@ class Bed12(SimpleBed, Named, Stranded):
                 raise ValueError("Length of block_sizes and block_starts must equal block_count!")
             if self.block_starts[0] != 0:
                 raise ValueError("block_starts must start with 0!")
-            if any(size <= 0 for size in self.block_sizes):
+            if min(self.block_sizes) <= 0:
                 raise ValueError("All sizes in block_size must be greater than or equal to one!")
             if (self.start + self.block_starts[-1] + self.block_sizes[-1]) != self.end:
                 raise ValueError("The last defined block's end must be equal to the BED end!")
@@ -330,26 +409,16 @@ class BedPE(PairBed, Named):
     @override
     def bed1(self) -> Bed6:
         """The first of the two intervals as a BED6 record."""
-        return Bed6(
-            refname=self.refname1,
-            start=self.start1,
-            end=self.end1,
-            name=self.name,
-            score=self.score,
-            strand=self.strand1,
+        return _positional_bed6(
+            self.refname1, self.start1, self.end1, self.name, self.score, self.strand1
         )
 
     @property
     @override
     def bed2(self) -> Bed6:
         """The second of the two intervals as a BED6 record."""
-        return Bed6(
-            refname=self.refname2,
-            start=self.start2,
-            end=self.end2,
-            name=self.name,
-            score=self.score,
-            strand=self.strand2,
+        return _positional_bed6(
+            self.refname2, self.start2, self.end2, self.name, self.score, self.strand2
         )
 
     @classmethod
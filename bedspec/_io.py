@@ -0,0 +1,177 @@
+import gzip
+import zlib
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from io import BufferedReader
+from io import FileIO
+from io import RawIOBase
+from io import TextIOWrapper
+from pathlib import Path
+from types import ModuleType
+from typing import BinaryIO
+
+from typing_extensions import Buffer
+from typing_extensions import override
+
+GZIP_MAGIC: bytes = b"\x1f\x8b"
+"""The magic bytes at the start of every gzip (and therefore BGZF) compressed file."""
+
+DEFAULT_BUFFER_SIZE: int = 1 << 20
+"""The default size of the buffer for sequentially reading or writing BED files (1 MiB)."""
+
+GZIP_SUFFIX: str = ".gz"
+"""The file suffix of BED files that are written gzip compressed."""
+
+BGZF_HEADER_SIZE: int = 18
+"""The size of the fixed gzip header, with its single `BC` extra subfield, of every BGZF block."""
+
+
+def _optional_module(name: str, fallback: ModuleType) -> ModuleType:
+    """Import an optional drop-in replacement of a module, or return the module it replaces."""
+    try:
+        return import_module(name)
+    except ImportError:
+        return fallback
+
+
+GZIP: ModuleType = _optional_module("isal.igzip", gzip)
+"""The module for reading gzip files: `isal.igzip` if it is installed, otherwise `gzip`."""
+
+ZLIB: ModuleType = _optional_module("isal.isal_zlib", zlib)
+"""The module for decompressing BGZF blocks: `isal.isal_zlib` if it is installed, else `zlib`."""
+
+
+def is_gzipped(header: bytes) -> bool:
+    """Return whether the first bytes of a file are the magic bytes of a gzip compressed file."""
+    return header[: len(GZIP_MAGIC)] == GZIP_MAGIC
+
+
+def is_bgzf(header: bytes) -> bool:
+    """Return whether the bytes are a gzip header with the extra field that marks a BGZF block."""
+    return (
+        len(header) >= BGZF_HEADER_SIZE
+        and header[:4] == b"\x1f\x8b\x08\x04"
+        and header[10:16] == b"\x06\x00BC\x02\x00"
+    )
+
+
+def _bgzf_blocks(handle: BinaryIO) -> Iterator[bytes]:
+    """Yield each compressed block, header included, of a BGZF stream without decompressing it."""
+    offset: int = 0
+    while header := handle.read(BGZF_HEADER_SIZE):
+        if not is_bgzf(header):
+            raise ValueError(f"Invalid BGZF block header at offset {offset}!")
+        block_size: int = int.from_bytes(header[16:18], "little") + 1
+        offset += block_size
+        yield header + handle.read(block_size - BGZF_HEADER_SIZE)
+
+
+class _ThreadedBgzfReader(RawIOBase):
+    """A binary stream that decompresses the independent blocks of a BGZF file on many threads.
+
+    Blocks are decompressed ahead of the reader in a bounded window and are returned in order.
+    """
+
+    def __init__(self, handle: BinaryIO, threads: int) -> None:
+        """Read a BGZF stream from an open binary handle with a pool of decompression threads."""
+        super().__init__()
+        self._handle: BinaryIO = handle
+        self._blocks: Iterator[bytes] = _bgzf_blocks(self._handle)
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=threads)
+        self._pending: deque[Future[bytes]] = deque()
+        self._window: int = 4 * threads
+        self._buffer: memoryview = memoryview(b"")
+        self._error: ValueError | None = None
+
+    @override
+    def readable(self) -> bool:
+        """Return that this stream is readable."""
+        return True
+
+    def _submit_blocks(self) -> None:
+        """Submit blocks for decompression until the window is full or the stream is exhausted.
+
+        An invalid block is remembered and only raised once every block before it has been read.
+        """
+        while self._error is None and len(self._pending) < self._window:
+            try:
+                block: bytes | None = next(self._blocks, None)
+            except ValueError as error:
+                self._error = error
+                return
+            if block is None:
+                return
+            self._pending.append(self._executor.submit(ZLIB.decompress, block, 31))
+
+    @override
+    def readinto(self, buffer: Buffer) -> int:
+        """Fill a buffer with the next decompressed bytes and return how many were written."""
+        while not self._buffer:
+            self._submit_blocks()
+            if not self._pending:
+                if self._error is not None:
+                    raise self._error
+                return 0
+            self._buffer = memoryview(self._pending.popleft().result())
+        target: memoryview = memoryview(buffer).cast("B")
+        size: int = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    @override
+    def close(self) -> None:
+        """Stop decompressing and close the underlying file."""
+        if not self.closed:
+            self._executor.shutdown(cancel_futures=True)
+            self._handle.close()
+        super().close()
+
+
+def open_text(
+    path: Path | str, threads: int = 1, buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> TextIOWrapper:
+    """Open a plain-text, gzip, or BGZF compressed file for reading text.
+
+    BGZF files are a series of gzip members, so both compressed formats are read by `gzip`, or by
+    the faster `isal.igzip` if it is installed. When more than one thread is requested, BGZF blocks
+    are decompressed in parallel instead. Compression is detected by peeking at the first bytes of
+    the open file, so files that can only be read once, like named pipes, are supported.
+
+    Args:
+        path: the path to the file to open.
+        threads: the number of threads to decompress a BGZF file with.
+        buffer_size: the size of the buffer of bytes to read ahead, unless read through `gzip`.
+    """
+    path = Path(path).expanduser()
+    if threads < 1:
+        raise ValueError(f"The number of threads must be at least 1 but found: {threads}")
+    raw: FileIO = open(path, "rb", buffering=0)
+    handle: BufferedReader = BufferedReader(raw, buffer_size)
+    header: bytes = handle.peek(BGZF_HEADER_SIZE)[:BGZF_HEADER_SIZE]
+    if threads > 1 and is_bgzf(header):
+        return TextIOWrapper(BufferedReader(_ThreadedBgzfReader(handle, threads), buffer_size))
+    elif is_gzipped(header):
+        compressed: gzip.GzipFile = GZIP.GzipFile(fileobj=handle, mode="rb")
+        compressed.myfileobj = raw  # close the file with the gzip stream, as `gzip.open` does
+        return TextIOWrapper(compressed)
+    return TextIOWrapper(handle)
+
+
+def open_text_for_writing(
+    path: Path | str, buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> TextIOWrapper:
+    """Open a file for writing text, gzip compressed if the name of the file ends with `.gz`.
+
+    Args:
+        path: the path to the file to open.
+        buffer_size: the size of the buffer of bytes to collect, unless written through `gzip`.
+    """
+    path = Path(path).expanduser()
+    if path.suffix == GZIP_SUFFIX:
+        handle: TextIOWrapper = GZIP.open(path, "wt")
+        return handle
+    return path.open("w", buffering=buffer_size)
@@ -1,4 +1,15 @@
+import csv
+import re
+import sys
+from collections.abc import Callable
+from collections.abc import Iterator
+from dataclasses import fields
+from enum import Enum
+from functools import cache
+from functools import lru_cache
 from io import TextIOWrapper
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from types import NoneType
 from types import UnionType
@@ -6,6 +17,7 @@ from typing import Any
 from typing import get_args
 from typing import get_origin
 
+from msgspec import convert
 from typeline import TsvReader
 from typing_extensions import Self
 from typing_extensions import override
@@ -13,8 +25,316 @@ from typing_extensions import override
 from bedspec._bedspec import COMMENT_PREFIXES
 from bedspec._bedspec import MISSING_FIELD
 from bedspec._bedspec import BedColor
+from bedspec._bedspec import BedLike
 from bedspec._bedspec import BedStrand
 from bedspec._bedspec import BedType
+from bedspec._bedspec import PairBed
+from bedspec._bedspec import SimpleBed
+from bedspec._bedspec import check_bed_type
+from bedspec._bedspec import field_types_of
+from bedspec._bedspec import is_string_enum
+from bedspec._io import DEFAULT_BUFFER_SIZE
+from bedspec._io import open_text
+from bedspec._table import BedTable
+from bedspec._table import Column
+from bedspec._table import empty_column
+from bedspec._table import extend_column
+from bedspec._writer import BedWriter
+
+Converter = Callable[[str], Any]
+"""A callable that converts one BED column string into a typed Python value."""
+
+INTERNED_FIELDS: frozenset[str] = frozenset({"refname", "refname1", "refname2"})
+"""Names of string fields whose few distinct values are shared across all decoded records."""
+
+
+class _LookupTable(dict[str, Any]):
+    """A lookup table that decodes the few valid strings of a BED field into their values."""
+
+    def __init__(self, type_name: str, values: dict[str, Any], ignore_case: bool = False) -> None:
+        """Build a lookup table for the values of a type from their string representations."""
+        super().__init__(values)
+        self._type_name: str = type_name
+        self._ignore_case: bool = ignore_case
+
+    def __missing__(self, key: str) -> Any:
+        """Retry a key in lower case, if case is ignored, or raise an error like an enum would."""
+        if self._ignore_case and (lowered := key.lower()) != key and lowered in self:
+            return self[lowered]
+        raise ValueError(f"{key!r} is not a valid {self._type_name}")
+
+
+def _enum_table(enum_type: type[Enum]) -> _LookupTable:
+    """Build a lookup table that decodes members of an enum from their string values."""
+    return _LookupTable(enum_type.__name__, {member.value: member for member in enum_type})
+
+
+STRANDS: _LookupTable = _enum_table(BedStrand)
+"""A lookup table that decodes BED strands without going through the enum constructor."""
+
+MISSING_VALUES: frozenset[str] = frozenset({MISSING_FIELD, "", "null"})
+"""The values of optional BED fields that are decoded as `None`, the same as the generic path."""
+
+OPTIONAL_STRANDS: _LookupTable = _LookupTable(BedStrand.__name__, {**STRANDS, MISSING_FIELD: None})
+"""A lookup table that decodes optional BED strands, where a missing strand is decoded as `None`."""
+
+BOOLS: _LookupTable = _LookupTable(
+    bool.__name__, {"true": True, "false": False, "1": True, "0": False}, ignore_case=True
+)
+"""A lookup table that decodes booleans from `true` or `false` in any case, or from `1` or `0`."""
+
+
+COLOR_CACHE_SIZE: int = 1024
+"""The number of distinct BED colors whose decoded values are cached by the reader."""
+
+_color_from_string: Callable[[str], BedColor] = lru_cache(maxsize=COLOR_CACHE_SIZE)(
+    BedColor.from_string
+)
+"""Decode a BED color, sharing one immutable color among all records with the same color string."""
+
+
+INTEGER: re.Pattern[str] = re.compile(r"-?[0-9]+")
+"""The syntax of an integer BED field: ASCII digits with an optional leading minus sign."""
+
+FLOAT: re.Pattern[str] = re.compile(r"-?[0-9]+(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?")
+"""The syntax of a floating point BED field, which is the syntax of a JSON number."""
+
+
+def _integer(item: str) -> int:
+    """Decode an integer, rejecting the underscores, signs, and spaces that `int()` allows."""
+    if INTEGER.fullmatch(item) is None:
+        raise ValueError(f"invalid literal for int() with base 10: {item!r}")
+    return int(item)
+
+
+def _float(item: str) -> float:
+    """Decode a float, rejecting the underscores, `nan`, and `inf` that `float()` allows."""
+    if FLOAT.fullmatch(item) is None:
+        raise ValueError(f"could not convert string to float: {item!r}")
+    return float(item)
+
+
+SCALAR_CONVERTERS: dict[Any, Converter] = {
+    str: str,
+    int: _integer,
+    float: _float,
+    bool: BOOLS.__getitem__,
+    BedStrand: STRANDS.__getitem__,
+    BedColor: _color_from_string,
+}
+"""The converters of the scalar field types that are decoded without the generic path."""
+
+SCALAR_TYPES: dict[Converter, type] = {str: str, _integer: int, _float: float}
+"""The field types of the scalar converters whose fields are converted inline."""
+
+INLINE_NAMESPACE: dict[str, Any] = {
+    "missing": MISSING_VALUES,
+    "is_digits": frozenset("0123456789").issuperset,
+    "is_float_chars": frozenset("0123456789.-eE").issuperset,
+    "integer": _integer,
+    "real": _float,
+}
+"""The names that inline conversions in generated decoders call to check and convert numbers."""
+
+
+def _optional(converter: Converter) -> Converter:
+    """Wrap a converter so that a missing BED field is decoded as `None`."""
+
+    def convert(item: str) -> Any:
+        return None if item in MISSING_VALUES else converter(item)
+
+    return convert
+
+
+def _color_or_none(item: str) -> BedColor | None:
+    """Decode a missing BED color, or the special value `0` that means the color is unset."""
+    return None if item == MISSING_FIELD or item == "0" else _color_from_string(item)
+
+
+def _collection(container: type[Any], converter: Converter) -> Converter:
+    """Build a converter for a comma-delimited BED collection (e.g. BED12 block sizes)."""
+
+    def convert(item: str) -> Any:
+        stripped: str = item.rstrip(",")
+        return container(map(converter, stripped.split(","))) if stripped else container()
+
+    return convert
+
+
+def _converter_for(field_type: type[Any] | str | Any) -> Converter | None:
+    """Return a converter for a field type, or `None` if the type must use the generic path."""
+    if field_type in SCALAR_CONVERTERS:
+        return SCALAR_CONVERTERS[field_type]
+    elif is_string_enum(field_type):
+        return _enum_table(field_type).__getitem__
+
+    type_origin: type | None = get_origin(field_type)
+    type_args: tuple[Any, ...] = get_args(field_type)
+
+    if isinstance(field_type, UnionType) and len(type_args) == 2 and NoneType in type_args:
+        other_type: type = next(arg for arg in type_args if arg is not NoneType)
+        converter: Converter | None = _converter_for(other_type)
+        if converter is None:
+            return None
+        elif other_type is BedStrand:
+            return OPTIONAL_STRANDS.__getitem__
+        elif other_type is BedColor:
+            return _color_or_none
+        return _optional(converter)
+    elif type_origin in (frozenset, list, set, tuple):
+        if type_origin is tuple and not (len(type_args) == 2 and type_args[1] is Ellipsis):
+            return None
+        element: Converter | None = _converter_for(type_args[0]) if type_args else None
+        return None if element is None else _collection(type_origin, element)
+
+    return None
+
+
+@cache
+def _converters_for(record_type: type[BedLike]) -> tuple[Converter, ...] | None:
+    """Return the field converters of a BED type, or `None` if it must use the generic path.
+
+    The converters are resolved once per BED type and shared by every reader of that type.
+    """
+    converters: list[Converter | None] = [
+        sys.intern
+        if field.name in INTERNED_FIELDS and field_type is str
+        else _converter_for(field_type)
+        for field, field_type in zip(fields(record_type), field_types_of(record_type), strict=True)
+    ]
+    return tuple(filter(None, converters)) if None not in converters else None
+
+
+def _scalar_source(item: str, field_type: type[Any]) -> str:
+    """Return the source code of an expression that converts a string, integer, or float column.
+
+    Numbers are only converted inline if all of their characters are ones that a plain number can
+    have, which excludes the underscores, signs, and letters of the extra syntax that `int()` and
+    `float()` allow. Other numbers call the converter that checks their syntax in full.
+    """
+    if field_type is int:
+        return f"(int({item}) if is_digits({item}) else integer({item}))"
+    elif field_type is float:
+        return f"(float({item}) if is_float_chars({item}) else real({item}))"
+    return item
+
+
+def _field_source(index: int, field_type: type[Any] | str | Any, converter: Converter) -> str:
+    """Return the source code of an expression that converts one column of a BED line.
+
+    Strings, numbers, and their optional forms are converted inline. Other types call their
+    converter, which is bound to the name `c<index>` when the decoder is generated.
+    """
+    item: str = f"f{index}"
+    if converter is str or converter is _integer or converter is _float:
+        return _scalar_source(item, SCALAR_TYPES[converter])
+
+    type_args: tuple[Any, ...] = get_args(field_type)
+    if isinstance(field_type, UnionType) and len(type_args) == 2 and NoneType in type_args:
+        other_type: type = next(arg for arg in type_args if arg is not NoneType)
+        if other_type is str or other_type is int or other_type is float:
+            value: str = _scalar_source(item, other_type)
+            return f"(None if {item} in missing else {value})"
+
+    return f"c{index}({item})"
+
+
+@cache
+def _decoder_for(record_type: type[BedType]) -> Callable[[list[str]], BedType] | None:
+    """Generate a function that decodes the split columns of a BED line into a BED record.
+
+    The function unpacks the columns and converts each one straight into a keyword argument of
+    the BED type, which avoids building an intermediate dictionary for every line. Common column
+    types are converted inline, without calling a converter function. Records are allocated and
+    then initialized directly, which validates them the same as calling the BED type does but
+    avoids the slower keyword argument handling of calling a class. It raises a
+    `ValueError` for lines with the wrong number of columns or with columns that cannot be
+    converted. It is generated once per BED type, or is `None` if the type must use the generic
+    path.
+    """
+    converters: tuple[Converter, ...] | None = _converters_for(record_type)
+    if converters is None:
+        return None
+    names: list[str] = [field.name for field in fields(record_type)]
+    field_types: tuple[type[Any] | str | Any, ...] = field_types_of(record_type)
+    arguments: list[str] = [
+        f"{name}={_field_source(index, field_type, converter)}"
+        for index, (name, field_type, converter) in enumerate(
+            zip(names, field_types, converters, strict=True)
+        )
+    ]
+    if record_type.__new__ is object.__new__:
+        construct: str = f"record = new(record_type)\n    init(record, {', '.join(arguments)})\n"
+    else:
+        construct = f"record = record_type({', '.join(arguments)})\n"
+    source: str = (
+        "def decode(items):\n"
+        + f"    {''.join(f'f{index}, ' for index in range(len(names)))}= items\n"
+        + f"    {construct}"
+        + "    return record\n"
+    )
+    namespace: dict[str, Any] = {f"c{index}": convert for index, convert in enumerate(converters)}
+    namespace.update(INLINE_NAMESPACE)
+    namespace.update(record_type=record_type, new=object.__new__, init=record_type.__init__)
+    exec(source, namespace)
+    decoder: Callable[[list[str]], BedType] = namespace["decode"]
+    return decoder
+
+
+def _column_source(index: int, field_type: type[Any] | str | Any, converter: Converter) -> str:
+    """Return the source code of an expression that converts one column of many BED lines.
+
+    The characters of an integer or float column are checked all at once, so that its values are
+    only checked one by one if the column has a character that a plain number cannot have.
+    """
+    item: str = f"f{index}"
+    checked: str = f"[{_field_source(index, field_type, converter)} for {item} in s{index}]"
+    if converter is _integer:
+        is_plain: str = f"is_digits(''.join(s{index} := list(map(g{index}, rows))))"
+        return f"([int({item}) for {item} in s{index}] if {is_plain} else {checked})"
+    elif converter is _float:
+        is_plain = f"is_float_chars(''.join(s{index} := list(map(g{index}, rows))))"
+        return f"([float({item}) for {item} in s{index}] if {is_plain} else {checked})"
+    return f"[{_field_source(index, field_type, converter)} for {item} in map(g{index}, rows)]"
+
+
+@cache
+def _columns_decoder_for(
+    record_type: type[BedType],
+) -> Callable[[list[list[str]]], list[list[Any]]] | None:
+    """Generate a function that decodes the split columns of many BED lines into field columns.
+
+    The function converts each column with a list comprehension over the split lines, using the
+    same conversions as the record decoder, so the lines never have to be transposed. The
+    lines must all have one column per field. It is generated once per BED type, or is `None` if
+    the type must use the generic path.
+    """
+    converters: tuple[Converter, ...] | None = _converters_for(record_type)
+    if converters is None:
+        return None
+    columns: list[str] = [
+        _column_source(index, field_type, converter)
+        for index, (field_type, converter) in enumerate(
+            zip(field_types_of(record_type), converters, strict=True)
+        )
+    ]
+    source: str = f"def decode_columns(rows):\n    return [{', '.join(columns)}]\n"
+    namespace: dict[str, Any] = {f"c{index}": convert for index, convert in enumerate(converters)}
+    namespace.update(INLINE_NAMESPACE)
+    namespace.update({f"g{index}": itemgetter(index) for index in range(len(converters))})
+    exec(source, namespace)
+    decoder: Callable[[list[list[str]]], list[list[Any]]] = namespace["decode_columns"]
+    return decoder
+
+
+QUOTE_CHAR: str = "'"
+"""The character that quotes fields in the generic delimited data parsing path."""
+
+TABLE_CHUNK_SIZE: int = 65_536
+"""The number of BED lines that are decoded into columns together when reading a BED table."""
+
+SPAN_VALIDATORS: frozenset[Any] = frozenset({SimpleBed.__post_init__, PairBed.__post_init__})
+"""Validators that only check the spans of a BED record, which a BED table checks by column."""
 
 
 class BedReader(TsvReader[BedType]):
@@ -37,7 +357,202 @@ class BedReader(TsvReader[BedType]):
             header: whether we expect the first line to be a header or not.
             comment_prefixes: skip lines that have any of these string prefixes.
         """
+        check_bed_type(record_type)
         super().__init__(handle, record_type, header=header, comment_prefixes=comment_prefixes)
+        self._names: tuple[str, ...] = tuple(self._header)
+        self._field_types: list[type | str | Any] = list(field_types_of(record_type))
+        self._converters: tuple[Converter, ...] | None = _converters_for(record_type)
+        self._record_decoder: Callable[[list[str]], BedType] | None = _decoder_for(record_type)
+        self._columns_decoder: Callable[[list[list[str]]], list[list[Any]]] | None = (
+            _columns_decoder_for(record_type)
+        )
+        self._validates_rows: bool = (
+            getattr(record_type, "__post_init__", None) not in SPAN_VALIDATORS
+        )
+
+    @override
+    def __iter__(self) -> Iterator[BedType]:
+        """Yield BED records by converting each tab-delimited column directly into its type.
+
+        BED data is almost always tab-delimited and unquoted, so each line is split and every
+        column is converted with a converter chosen once per field. Quoted lines, lines this fast
+        path rejects, and record types with fields it does not understand fall back to the generic
+        delimited data parsing path.
+        """
+        if self._record_decoder is None:
+            return super().__iter__()
+        return self._decode_lines(self._handle, self._record_decoder)
+
+    def _decode_lines(
+        self, lines: Iterator[str], decode: Callable[[list[str]], BedType]
+    ) -> Iterator[BedType]:
+        """Decode BED lines into BED records with a generated record decoder.
+
+        Lines with a quote character are decoded through the generic path instead, which strips the
+        quotes from quoted fields the same as it did before the fast path existed.
+        """
+        delimiter: str = self.delimiter
+
+        for line in self._filter_out_comments(lines):
+            items: list[str] = line.rstrip("\r\n").split(delimiter)
+            try:
+                record: BedType = (
+                    decode(items) if QUOTE_CHAR not in line else self._decode_generically(line)
+                )
+            except ValueError as exception:
+                record = self._decode_rejected_line(line, items, decode, exception)
+            yield record
+
+    def _decode_generically(self, line: str) -> BedType:
+        """Decode a BED line through the generic delimited data parsing path."""
+        row: list[str] = next(csv.reader([line], delimiter=self.delimiter, quotechar=QUOTE_CHAR))
+        as_builtins: dict[str, Any] = self._csv_dict_to_json(
+            dict(zip(self._names, row, strict=True))
+        )
+        return convert(as_builtins, self._record_type, strict=False, str_keys=True)
+
+    def _decode_rejected_line(
+        self,
+        line: str,
+        items: list[str],
+        decode: Callable[[list[str]], BedType],
+        exception: ValueError,
+    ) -> BedType:
+        """Decode a BED line that one path rejected with the other path, or raise.
+
+        The generic path converts numbers leniently, such as `1.0` into an integer, and the fast
+        path reads quote characters verbatim when they do not quote a valid line. If both paths fail
+        then a helpful exception is raised instead.
+        """
+        try:
+            return self._decode_generically(line) if QUOTE_CHAR not in line else decode(items)
+        except ValueError:
+            pass
+        self._raise_for_invalid_fields(line, items)
+        raise exception
+
+    def pipe(
+        self, writer: BedWriter[BedType], predicate: Callable[[str], bool] | None = None
+    ) -> None:
+        """Copy the remaining BED lines of this reader to a BED writer without decoding them.
+
+        Comment and blank lines are skipped and every other line is copied verbatim, so lines are
+        neither decoded into BED records nor validated. This is much faster than reading and writing
+        BED records when BED data only needs to be filtered.
+
+        Args:
+            writer: the BED writer to copy lines to.
+            predicate: if given, only copy the lines for which this test of the raw line is true.
+        """
+        lines: Iterator[str] = self._filter_out_comments(self._handle)
+        writer.write_lines(lines if predicate is None else filter(predicate, lines))
+
+    def read_table(self) -> BedTable[BedType]:
+        """Read all remaining BED records into a column-oriented BED table.
+
+        Lines are decoded straight into columns, so no BED record objects are built. Lines are read
+        and split in chunks, and then every column of a chunk is converted in one pass with a
+        function generated once per BED type. A chunk with a quoted line, or with a line that
+        cannot be converted this way, is decoded line by line instead, so that the line is read or
+        reported like any other.
+
+        Every row is validated like a BED record read on its own. Spans are validated by column
+        when the table is built, and BED types that validate more than their spans also have every
+        row of a chunk built into a BED record, which is then discarded.
+        """
+        columns: dict[str, Column] = {
+            name: empty_column(field_type)
+            for name, field_type in zip(self._names, self._field_types, strict=True)
+        }
+        decode_columns = self._columns_decoder
+        decode = self._record_decoder
+
+        if decode_columns is None or decode is None:
+            for record in self:
+                for name in self._names:
+                    extend_column(columns, name, (getattr(record, name),))
+            return BedTable(self._record_type, columns)
+
+        delimiter: str = self.delimiter
+        num_fields: int = len(self._names)
+
+        while chunk := list(islice(self._handle, TABLE_CHUNK_SIZE)):
+            line_count: int = self._line_count
+            rows: list[list[str]] = [
+                line.rstrip("\r\n").split(delimiter)
+                for line in self._filter_out_comments(iter(chunk))
+            ]
+            if not rows:
+                continue
+            try:
+                if any(len(row) != num_fields for row in rows) or QUOTE_CHAR in "".join(chunk):
+                    raise ValueError("A chunk of BED lines must be decoded line by line!")
+                decoded: list[list[Any]] = decode_columns(rows)
+                if self._validates_rows:
+                    for row in zip(*decoded, strict=True):
+                        _ = self._record_type(**dict(zip(self._names, row, strict=True)))
+            except ValueError:
+                self._line_count = line_count  # pyright: ignore[reportUnannotatedClassAttribute]
+                decoded = [[] for _ in self._names]
+                for record in self._decode_lines(iter(chunk), decode):
+                    for values, name in zip(decoded, self._names, strict=True):
+                        values.append(getattr(record, name))
+            for name, values in zip(self._names, decoded, strict=True):
+                extend_column(columns, name, values)
+
+        return BedTable(self._record_type, columns)
+
+    @override
+    def _filter_out_comments(self, lines: Iterator[str]) -> Iterator[str]:
+        """Yield only lines that are not blank and do not start with a comment prefix.
+
+        Comment prefixes are only tested, with a single call to `str.startswith`, for lines whose
+        first character starts a comment prefix. Lines are only stripped when they start with
+        whitespace, which data lines never do, so that blank lines and indented comments are still
+        skipped without copying every line.
+        """
+        comment_prefixes: tuple[str, ...] = tuple(self._comment_prefixes)
+        first_chars: frozenset[str] = frozenset(prefix[:1] for prefix in comment_prefixes)
+        for line in lines:
+            self._line_count += 1
+            if not line:
+                continue
+            first: str = line[0]
+            if first in first_chars and line.startswith(comment_prefixes):
+                continue
+            elif first.isspace():
+                stripped: str = line.strip()
+                if not stripped or stripped.startswith(comment_prefixes):
+                    continue
+            yield line
+
+    def _raise_for_invalid_fields(self, line: str, items: list[str]) -> None:
+        """Raise a helpful exception if a BED line has the wrong number of fields or bad fields.
+
+        This is only called after decoding a line failed, so that decoding valid lines never pays
+        for these checks. If the fields are valid, the failure came from validating the record.
+        """
+        if len(items) != len(self._names):
+            raise self._field_count_error(line, len(items))
+        for converter, item in zip(self._converters or (), items, strict=True):
+            try:
+                _ = converter(item)
+            except ValueError as exception:
+                raise self._conversion_error(line, exception) from exception
+
+    def _field_count_error(self, line: str, num_items: int) -> ValueError:
+        """Build the exception for a BED line with the wrong number of fields."""
+        return ValueError(
+            f"Expected {len(self._names)} fields for a {self._record_type.__name__} but found"
+            + f" {num_items} on line {self._line_count}: {line!r}"
+        )
+
+    def _conversion_error(self, line: str, exception: Exception) -> ValueError:
+        """Build the exception for a BED line with a field that could not be converted."""
+        return ValueError(
+            f"Could not parse line {self._line_count} into a {self._record_type.__name__}:"
+            + f" {line!r}. Original exception: {exception}"
+        )
 
     @override
     def _decode(self, field_type: type[Any] | str | Any, item: str) -> str:
@@ -80,15 +595,21 @@ class BedReader(TsvReader[BedType]):
         /,
         header: bool = False,
         comment_prefixes: set[str] = COMMENT_PREFIXES,
+        threads: int = 1,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
     ) -> Self:
         """Construct a BED reader from a file path.
 
+        Gzip and BGZF compressed files are detected by their magic bytes and decompressed.
+
         Args:
             path: the path to the file to read delimited data from.
             record_type: the type of the object we will be writing.
             header: whether we expect the first line to be a header or not.
             comment_prefixes: skip lines that have any of these string prefixes.
+            threads: the number of threads to decompress the blocks of a BGZF file with.
+            buffer_size: the size of the buffer of bytes to read ahead, unless read through `gzip`.
         """
-        handle = Path(path).open("r")
+        handle = open_text(path, threads=threads, buffer_size=buffer_size)
         reader = cls(handle, record_type, header=header, comment_prefixes=comment_prefixes)
         return reader
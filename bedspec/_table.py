@@ -0,0 +1,117 @@
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import MutableSequence
+from dataclasses import fields
+from operator import lt
+from typing import Any
+from typing import Generic
+
+from typing_extensions import override
+
+from bedspec._bedspec import BedType
+
+Column = MutableSequence[Any]
+"""A single column of BED field values."""
+
+SPAN_FIELDS: tuple[tuple[str, str], ...] = (
+    ("start", "end"),
+    ("start1", "end1"),
+    ("start2", "end2"),
+)
+"""Pairs of start and end field names that must describe valid 0-based half-open intervals."""
+
+
+def empty_column(field_type: type[Any] | str | Any) -> Column:
+    """Return an empty column, packed into a native array when the field type allows it."""
+    if field_type is int:
+        return array("q")
+    elif field_type is float:
+        return array("d")
+    return []
+
+
+def extend_column(columns: dict[str, Column], name: str, values: Iterable[Any]) -> None:
+    """Extend a column with values, unpacking a native array into a list if a value overflows it."""
+    column: Column = columns[name]
+    size: int = len(column)
+    try:
+        column.extend(values)
+    except OverflowError:
+        columns[name] = [*column[:size], *values]
+
+
+def _validate_spans(columns: dict[str, Column]) -> None:
+    """Validate that every start and end column pair describes valid intervals."""
+    for start_name, end_name in SPAN_FIELDS:
+        if start_name not in columns or end_name not in columns or not columns[start_name]:
+            continue
+        starts, ends = columns[start_name], columns[end_name]
+        if min(starts) >= 0 and all(map(lt, starts, ends)):
+            continue
+        row: int = next(
+            row
+            for row, (start, end) in enumerate(zip(starts, ends, strict=True))
+            if start < 0 or start >= end
+        )
+        raise ValueError(
+            f"{start_name} must be greater than 0 and less than {end_name}!"
+            + f" Found {start_name}={starts[row]} and {end_name}={ends[row]} on row {row}."
+        )
+
+
+class BedTable(Iterable[BedType], Generic[BedType]):
+    """A column-oriented table of BED records.
+
+    Instead of one Python object per record, a BED table stores one column per field of the BED
+    type. Integer fields are packed into `array("q")` columns, or lists if a value needs more than
+    64 bits, float fields into `array("d")` columns, and all other fields are stored in lists.
+    Interval-based workloads that only need a few columns (e.g. `refname`, `start`, and `end`) can
+    use the columns directly.
+
+    Start and end coordinates are validated when the table is built. BED records, and any other
+    validation they perform, are only built when the table is iterated, except that a table read
+    with `BedReader.read_table` has every row validated like a BED record as it is read.
+    """
+
+    def __init__(self, record_type: type[BedType], columns: dict[str, Column]) -> None:
+        """Build a BED table from a BED type and one column per field of that type.
+
+        Args:
+            record_type: the type of BED record stored in this table.
+            columns: a mapping of field name to the values of that field.
+        """
+        names: list[str] = [field.name for field in fields(record_type)]
+        if list(columns) != names:
+            raise ValueError(f"Columns must be the fields of {record_type.__name__}: {names}")
+        if len({len(column) for column in columns.values()}) > 1:
+            raise ValueError("All columns must have the same length!")
+        _validate_spans(columns)
+        self._record_type: type[BedType] = record_type
+        self._columns: dict[str, Column] = columns
+
+    @property
+    def record_type(self) -> type[BedType]:
+        """The type of BED record stored in this table."""
+        return self._record_type
+
+    @property
+    def columns(self) -> dict[str, Column]:
+        """The columns of this table keyed by field name."""
+        return self._columns
+
+    def __getitem__(self, name: str) -> Column:
+        """Return the column for a field name."""
+        return self._columns[name]
+
+    def __len__(self) -> int:
+        """The number of records in this table."""
+        return len(next(iter(self._columns.values()), ()))
+
+    @override
+    def __iter__(self) -> Iterator[BedType]:
+        """Iterate over the records of this table, building each BED record on demand."""
+        names: tuple[str, ...] = tuple(self._columns)
+        record_type: type[BedType] = self._record_type
+        for row in zip(*self._columns.values(), strict=True):
+            yield record_type(**dict(zip(names, row, strict=True)))
@@ -1,16 +1,166 @@
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from dataclasses import fields
+from functools import cache
+from io import TextIOWrapper
+from itertools import islice
+from itertools import repeat
+from pathlib import Path
+from types import NoneType
+from types import UnionType
 from typing import Any
+from typing import get_args
+from typing import get_origin
 
+from msgspec.json import Encoder
 from typeline import TsvWriter
+from typing_extensions import Self
 from typing_extensions import override
 
 from bedspec._bedspec import COMMENT_PREFIXES
+from bedspec._bedspec import MISSING_FIELD
 from bedspec._bedspec import BedColor
+from bedspec._bedspec import BedLike
+from bedspec._bedspec import BedStrand
 from bedspec._bedspec import BedType
+from bedspec._bedspec import check_bed_type
+from bedspec._bedspec import field_types_of
+from bedspec._bedspec import is_string_enum
+from bedspec._io import DEFAULT_BUFFER_SIZE
+from bedspec._io import open_text_for_writing
+
+WRITE_CHUNK_SIZE: int = 4096
+"""The number of BED records that are formatted and written together when writing many records."""
+
+QUOTE_CHAR: str = "'"
+"""The quote character of the generic delimited data writer, which quotes fields that contain it."""
+
+ENCODE_JSON: Callable[[Any], bytes] = Encoder().encode
+"""Encode a value as JSON, which is how the generic delimited data writer formats numbers."""
+
+
+def _mismatched(value: Any) -> str:
+    """Raise for a field value that does not match its field type, so it is written generically."""
+    raise TypeError(f"Cannot format {value!r} with the format of its field type!")
+
+
+def _field_source(value: str, field_type: type[Any] | str | Any, index: int) -> str | None:
+    """Return the source code of an expression that formats one field value of a BED record.
+
+    Returns `None` if the field type must be formatted with the generic encoding path.
+    """
+    if field_type is str or field_type is BedStrand:
+        return value  # BED strands are strings, so they are joined without reading their value.
+    elif field_type is int:
+        return (
+            f"(str(v{index}) if (v{index} := {value}).__class__ is int else mismatched(v{index}))"
+        )
+    elif field_type is float:
+        return (
+            f"(encode_json(v{index}).decode() if (v{index} := {value}).__class__ is float"
+            f" or v{index}.__class__ is int else mismatched(v{index}))"
+        )
+    elif field_type is BedColor:
+        return (
+            f"(str(v{index}) if (v{index} := {value}).__class__ is BedColor"
+            f" else mismatched(v{index}))"
+        )
+    elif field_type is bool:
+        return (
+            f"(('true' if v{index} else 'false') if (v{index} := {value}).__class__ is bool"
+            f" else mismatched(v{index}))"
+        )
+    elif is_string_enum(field_type):
+        return f"{value}.value"
+
+    type_origin: type | None = get_origin(field_type)
+    type_args: tuple[Any, ...] = get_args(field_type)
+
+    if isinstance(field_type, UnionType) and len(type_args) == 2 and NoneType in type_args:
+        other_type: type = next(arg for arg in type_args if arg is not NoneType)
+        inner: str | None = _field_source(f"v{index}", other_type, index)
+        if inner is None:
+            return None
+        return f"({MISSING_FIELD!r} if (v{index} := {value}) is None else {inner})"
+    elif type_origin in (frozenset, list, set, tuple) and type_args:
+        if type_origin is tuple and not (len(type_args) == 2 and type_args[1] is Ellipsis):
+            return None
+        elif type_args[0] is str:
+            return f"','.join({value})"
+        elif type_args[0] is int or type_args[0] is float:
+            return f"','.join(map(str, {value}))"
+
+    return None
+
+
+@cache
+def _encoder_for(record_type: type[BedLike]) -> Callable[[Any], str] | None:
+    """Generate a function that formats a BED record as a line of BED text.
+
+    The function reads every field and formats it with an expression chosen once for its field
+    type, which avoids dispatching on the type of every value of every record. It is generated once
+    per BED type, or is `None` if the type must use the generic path.
+    """
+    sources: list[str | None] = [
+        _field_source(f"record.{field.name}", field_type, index)
+        for index, (field, field_type) in enumerate(
+            zip(fields(record_type), field_types_of(record_type), strict=True)
+        )
+    ]
+    if None in sources:
+        return None
+    source: str = (
+        f"def encode(record):\n    return '\\t'.join(({', '.join(map(str, sources))},)) + '\\n'\n"
+    )
+    namespace: dict[str, Any] = {
+        "BedColor": BedColor,
+        "encode_json": ENCODE_JSON,
+        "mismatched": _mismatched,
+    }
+    exec(source, namespace)
+    encoder: Callable[[Any], str] = namespace["encode"]
+    return encoder
 
 
 class BedWriter(TsvWriter[BedType]):
     """A writer for writing dataclasses into BED text data."""
 
+    @override
+    def __init__(self, handle: TextIOWrapper, record_type: type[BedType]) -> None:
+        """Instantiate a new BED writer.
+
+        Args:
+            handle: a file-like object to write BED records to.
+            record_type: the type of BED record we will be writing.
+        """
+        check_bed_type(record_type)
+        super().__init__(handle, record_type)
+        self._record_encoder: Callable[[Any], str] | None = (
+            _encoder_for(record_type)
+            if type(self)._encode is BedWriter._encode  # pyright: ignore[reportUnknownMemberType]
+            else None
+        )
+
+    @classmethod
+    @override
+    def from_path(
+        cls,
+        path: Path | str,
+        record_type: type[BedType],
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> Self:
+        """Construct a BED writer from a file path.
+
+        Files with names that end with `.gz` are written gzip compressed.
+
+        Args:
+            path: the path to the file to write BED records to.
+            record_type: the type of BED record we will be writing.
+            buffer_size: the size of the buffer of bytes to collect, unless written through `gzip`.
+        """
+        return cls(open_text_for_writing(path, buffer_size=buffer_size), record_type)
+
     @override
     def _encode(self, item: Any) -> Any:
         """A callback for overriding the encoding of builtin types and custom types."""
@@ -22,8 +172,94 @@ class BedWriter(TsvWriter[BedType]):
             return str(item)
         return super()._encode(item=item)
 
+    @override
+    def write(self, record: BedType) -> None:
+        """Write a BED record to the BED output.
+
+        Records are formatted with a function generated once for their BED type. Records with
+        fields that the generated function cannot format are formatted field by field, and records
+        with fields that do not format to a string or a number, or that the generic delimited data
+        writing path would quote, are written through that generic path.
+        """
+        if not isinstance(record, self._record_type):
+            raise ValueError(
+                f"Expected {self._record_type.__name__} but found {record.__class__.__qualname__}!"
+            )
+
+        line: str | None = None
+        if self._record_encoder is not None:
+            try:
+                line = self._record_encoder(record)
+            except (AttributeError, TypeError):
+                pass  # A field holds a value that does not match its type, so format generically.
+        else:
+            line = self._format_fields(record)
+
+        if line is None or self._needs_quoting(line, 1):
+            return super().write(record)
+
+        _ = self._handle.write(line)
+
+    def _format_fields(self, record: BedType) -> str | None:
+        """Format a BED record field by field, or return `None` to write it generically."""
+        items: list[str] = []
+        for name in self._header:
+            item: Any = self._encode(getattr(record, name))
+            if isinstance(item, str):
+                items.append(item)
+            elif type(item) is int or type(item) is float:
+                items.append(ENCODE_JSON(item).decode())
+            else:
+                return None
+        return "\t".join(items) + "\n"
+
+    def _needs_quoting(self, text: str, num_lines: int) -> bool:
+        """Return whether a field of some lines of BED text would be quoted by the generic path."""
+        return (
+            QUOTE_CHAR in text
+            or "\r" in text
+            or text.count("\n") != num_lines
+            or text.count("\t") != (len(self._header) - 1) * num_lines
+        )
+
+    def write_all(self, records: Iterable[BedType]) -> None:
+        """Write many BED records to the BED output.
+
+        Records are formatted in chunks and each chunk is joined into one string and written with a
+        single call, which is faster than writing every record, or every line, on its own.
+        """
+        if self._record_encoder is None:
+            for record in records:
+                self.write(record)
+            return None
+
+        encode: Callable[[Any], str] = self._record_encoder
+        record_type: type[BedType] = self._record_type
+        iterator: Iterator[BedType] = iter(records)
+
+        while chunk := list(islice(iterator, WRITE_CHUNK_SIZE)):
+            try:
+                if not all(map(isinstance, chunk, repeat(record_type))):
+                    raise TypeError(f"Not all records in the chunk are {record_type.__name__}!")
+                text: str = "".join(map(encode, chunk))
+                if self._needs_quoting(text, len(chunk)):
+                    raise TypeError("Some records in the chunk must be quoted!")
+            except (AttributeError, TypeError):
+                for record in chunk:
+                    self.write(record)
+            else:
+                _ = self._handle.write(text)
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        """Write lines of BED text to the BED output verbatim, without decoding or validating them.
+
+        Lines without a trailing newline are terminated with one.
+        """
+        self._handle.writelines(line if line.endswith("\n") else f"{line}\n" for line in lines)
+
     def write_comment(self, comment: str) -> None:
         """Write a comment to the BED output."""
+        comment_prefixes: tuple[str, ...] = tuple(COMMENT_PREFIXES)
         for line in comment.splitlines():
-            prefix = "" if any(line.startswith(prefix) for prefix in COMMENT_PREFIXES) else "# "
+            prefix = "" if line.startswith(comment_prefixes) else "# "
             _ = self._handle.write(f"{prefix}{line}\n")
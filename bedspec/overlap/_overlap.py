@@ -2,6 +2,8 @@ from collections import defaultdict
 from collections.abc import Iterable
 from collections.abc import Iterator
 from itertools import chain
+from itertools import groupby
+from operator import attrgetter
 from typing import Generic
 from typing import TypeAlias
 from typing import TypeVar
@@ -39,9 +41,9 @@ class OverlapDetector(Iterable[ReferenceSpanType], Generic[ReferenceSpanType]):
     def __init__(self, features: Iterable[ReferenceSpanType] | None = None) -> None:
         self._refname_to_features: dict[Refname, list[ReferenceSpanType]] = defaultdict(list)
         self._refname_to_tree: dict[Refname, IntervalTree] = defaultdict(IntervalTree)  # pyright: ignore[reportUnknownArgumentType]
-        self._refname_to_is_indexed: dict[Refname, bool] = defaultdict(lambda: False)
+        self._indexed_refnames: set[Refname] = set()
         if features is not None:
-            self.add(*features)
+            self.add_all(features)
 
     @override
     def __iter__(self) -> Iterator[ReferenceSpanType]:
@@ -50,37 +52,79 @@ class OverlapDetector(Iterable[ReferenceSpanType], Generic[ReferenceSpanType]):
 
     def add(self, *features: ReferenceSpanType) -> None:
         """Add a feature to this overlap detector."""
-        for feature in features:
-            refname: Refname = feature.refname
-            feature_index: int = len(self._refname_to_features[refname])
-
-            self._refname_to_features[refname].append(feature)
-            self._refname_to_tree[refname].add(feature.start, feature.end - 1, feature_index)  # pyright: ignore[reportUnknownMemberType]
-            self._refname_to_is_indexed[refname] = False  # mark that this tree needs re-indexing
+        self.add_all(features)
+
+    def add_all(self, features: Iterable[ReferenceSpanType]) -> None:
+        """Add all features to this overlap detector.
+
+        Consecutive features on the same reference sequence are added together, so adding features
+        that are sorted by reference sequence name is fastest.
+        """
+        for refname, group in groupby(features, key=attrgetter("refname")):
+            refname_features: list[ReferenceSpanType] = self._refname_to_features[refname]
+            tree_add = self._refname_to_tree[refname].add  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+            for feature in group:
+                tree_add(feature.start, feature.end - 1, len(refname_features))
+                refname_features.append(feature)
+            self._indexed_refnames.discard(refname)  # mark that this tree needs re-indexing
+
+    def freeze(self) -> None:
+        """Index the features of all reference sequences now instead of on their first query.
+
+        Features may still be added afterwards, and their reference sequence is indexed again on its
+        next query.
+        """
+        for refname, tree in self._refname_to_tree.items():  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+            if refname not in self._indexed_refnames:
+                tree.index()  # pyright: ignore[reportUnknownMemberType]
+                self._indexed_refnames.add(refname)
+
+    def _indexed_tree(self, refname: Refname) -> IntervalTree | None:  # pyright: ignore[reportUnknownParameterType]
+        """Return the interval tree of a reference sequence, indexed, if it has any features."""
+        tree: IntervalTree | None = self._refname_to_tree.get(refname)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        if tree is not None and refname not in self._indexed_refnames:
+            tree.index()  # pyright: ignore[reportUnknownMemberType]
+            self._indexed_refnames.add(refname)
+        return tree  # pyright: ignore[reportUnknownVariableType]
 
     def overlapping(self, feature: ReferenceSpan) -> Iterator[ReferenceSpanType]:
         """Yields all the overlapping features for a given query feature."""
-        refname: Refname = feature.refname
-
-        if refname in self._refname_to_tree.keys() and not self._refname_to_is_indexed[refname]:  # pyright: ignore[reportUnknownMemberType]
-            self._refname_to_tree[refname].index()  # pyright: ignore[reportUnknownMemberType]
+        tree: IntervalTree | None = self._indexed_tree(feature.refname)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        if tree is None:
+            return
 
+        refname_features: list[ReferenceSpanType] = self._refname_to_features[feature.refname]
         index: int
-        for index in self._refname_to_tree[refname].find_overlaps(feature.start, feature.end - 1):  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-            yield self._refname_to_features[refname][index]
+        for index in tree.find_overlaps(feature.start, feature.end - 1):  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+            yield refname_features[index]
 
     def overlaps(self, feature: ReferenceSpan) -> bool:
         """Determine if a query feature overlaps any other features."""
-        return next(self.overlapping(feature), None) is not None
+        tree: IntervalTree | None = self._indexed_tree(feature.refname)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        return tree is not None and bool(tree.any_overlaps(feature.start, feature.end - 1))  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
 
     def enclosing(self, feature: ReferenceSpan) -> Iterator[ReferenceSpanType]:
-        """Yields all the overlapping features that completely enclose the given query feature."""
-        for overlap in self.overlapping(feature):
-            if feature.start >= overlap.start and feature.end <= overlap.end:
+        """Yields all the overlapping features that completely enclose the given query feature.
+
+        Only features that contain the start of the query feature can enclose it, so the interval
+        tree is queried with that single position and only the ends of its hits are compared.
+        """
+        tree: IntervalTree | None = self._indexed_tree(feature.refname)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        if tree is None:
+            return
+
+        refname_features: list[ReferenceSpanType] = self._refname_to_features[feature.refname]
+        end: int = feature.end
+        index: int
+        for index in tree.find_overlaps(feature.start, feature.start):  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+            overlap: ReferenceSpanType = refname_features[index]
+            if end <= overlap.end:
                 yield overlap
 
     def enclosed_by(self, feature: ReferenceSpan) -> Iterator[ReferenceSpanType]:
         """Yields all the overlapping features that are enclosed by the given query feature."""
+        start: int = feature.start
+        end: int = feature.end
         for overlap in self.overlapping(feature):
-            if feature.start <= overlap.start and feature.end >= overlap.end:
+            if start <= overlap.start and end >= overlap.end:
                 yield overlap
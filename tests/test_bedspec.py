@@ -1,3 +1,10 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+from dataclasses import asdict
+from dataclasses import astuple
+from dataclasses import dataclass
+from dataclasses import fields
 from dataclasses import is_dataclass
 
 import pytest
@@ -40,6 +47,47 @@ def test_bed_color() -> None:
     assert str(BedColor(2, 3, 4)) == "2,3,4"
 
 
+def test_bed_color_is_immutable() -> None:
+    """Test that a BED color cannot be changed and compares and hashes by its values."""
+    color = BedColor(2, 3, 4)
+    assert color == BedColor(2, 3, 4)
+    assert hash(color) == hash(BedColor(2, 3, 4))
+    with pytest.raises(FrozenInstanceError):
+        color.r = 5  # type: ignore[misc]
+
+
+@pytest.mark.parametrize("stringify", [False, True])
+def test_bed_colors_can_be_pickled_copied_and_converted(stringify: bool) -> None:
+    """Test that BED colors, and records holding them, can be pickled, copied, and converted."""
+    color = BedColor(2, 3, 4)
+    bed = Bed12(
+        refname="chr1",
+        start=1,
+        end=2,
+        name="foo",
+        score=3,
+        strand=BedStrand.Positive,
+        thick_start=1,
+        thick_end=2,
+        item_rgb=color,
+        block_count=1,
+        block_sizes=[1],
+        block_starts=[0],
+    )
+    if stringify:
+        assert str(color) == "2,3,4"
+
+    for value in (color, bed):
+        assert pickle.loads(pickle.dumps(value)) == value
+        assert copy.copy(value) == value
+        assert copy.deepcopy(value) == value
+
+    assert [field.name for field in fields(color)] == ["r", "g", "b"]
+    assert asdict(color) == {"r": 2, "g": 3, "b": 4}
+    assert astuple(color) == (2, 3, 4)
+    assert asdict(bed)["item_rgb"] == {"r": 2, "g": 3, "b": 4}
+
+
 @pytest.mark.parametrize(
     "r,g,b",
     [
@@ -49,6 +97,9 @@ def test_bed_color() -> None:
         (256, 0, 0),
         (0, 256, 0),
         (0, 0, 256),
+        (-256, 0, 0),
+        (255, 256, 255),
+        (512, -1, 0),
     ],
 )
 def test_bed_color_validation(r: int, g: int, b: int) -> None:
@@ -59,6 +110,12 @@ def test_bed_color_validation(r: int, g: int, b: int) -> None:
         BedColor(r, g, b)
 
 
+@pytest.mark.parametrize("r,g,b", [(0, 0, 0), (255, 255, 255), (0, 128, 255)])
+def test_bed_color_accepts_values_at_the_bounds_of_the_range(r: int, g: int, b: int) -> None:
+    """Test that BED colors can be made with values at the bounds of the allowed range."""
+    assert str(BedColor(r, g, b)) == f"{r},{g},{b}"
+
+
 def test_bed_color_from_string() -> None:
     """Test that we can build a BED color from a string."""
     assert BedColor.from_string("2,3,4") == BedColor(2, 3, 4)
@@ -82,6 +139,12 @@ def test_all_bed_types_are_dataclasses(bed_type: type[BedLike]) -> None:
     assert is_dataclass(bed_type)
 
 
+@pytest.mark.parametrize("bed_type", (Bed2, Bed3, Bed4, Bed5, Bed6, Bed12, BedGraph, BedPE))
+def test_all_bed_types_are_slotted(bed_type: type[BedLike]) -> None:
+    """Test that builtin BED records do not carry a per-instance attribute dictionary."""
+    assert "__dict__" not in dir(bed_type)
+
+
 def test_locatable_structural_type() -> None:
     """Test that the ReferenceSpan structural type is set correctly."""
     span: ReferenceSpan = Bed6(
@@ -98,6 +161,13 @@ def test_stranded_structural_type() -> None:
     assert isinstance(stranded, Stranded)
 
 
+def test_structural_types_reject_records_missing_their_attributes() -> None:
+    """Test that records without the attributes of a structural type are not instances of it."""
+    bed: Bed2 = Bed2(refname="chr1", start=1)
+    assert not isinstance(bed, ReferenceSpan)
+    assert not isinstance(bed, Stranded)
+
+
 def test_dataclass_protocol_structural_type() -> None:
     """Test that the dataclass structural type is set correctly."""
     bed: DataclassInstance = Bed2(refname="chr1", start=1)
@@ -144,6 +214,31 @@ def test_paired_bed_has_two_interval_properties() -> None:
     assert record.bed2 == Bed6(refname="chr2", start=3, end=4, name="foo", score=5, strand=BedStrand.Negative)  # fmt: skip  # noqa: E501
 
 
+def test_paired_bed_intervals_are_validated_after_mutation() -> None:
+    """Test that the intervals of a paired BED are validated when a mutation made them invalid."""
+    record = BedPE(
+        refname1="chr1",
+        start1=1,
+        end1=2,
+        refname2="chr2",
+        start2=3,
+        end2=4,
+        name="foo",
+        score=5,
+        strand1=BedStrand.Positive,
+        strand2=BedStrand.Negative,
+    )
+    record.start1 = 2
+    record.end2 = -1
+
+    with pytest.raises(ValueError, match="start must be greater than 0 and less than end!"):
+        _ = record.bed1
+    with pytest.raises(ValueError, match="start must be greater than 0 and less than end!"):
+        _ = record.bed2
+    with pytest.raises(ValueError, match="start must be greater than 0 and less than end!"):
+        _ = list(record.territory())
+
+
 def test_point_bed_types_have_a_territory() -> None:
     """Test that a point BED has a territory of 1-length."""
     expected = Bed3(refname="chr1", start=1, end=2)
@@ -223,6 +318,27 @@ def test_paired_bed_types_have_a_territory() -> None:
     assert list(record.territory()) == expected
 
 
+def test_custom_paired_bed_types_have_a_territory_of_bed3_records() -> None:
+    """Test that a custom paired BED uses two BED3 records as its territory."""
+
+    @dataclass(slots=True)
+    class BedPair(PairBed):
+        refname1: str
+        start1: int
+        end1: int
+        refname2: str
+        start2: int
+        end2: int
+
+    record = BedPair("chr1", 1, 2, "chr2", 3, 4)
+    expected: list[Bed3] = [
+        Bed3(refname="chr1", start=1, end=2),
+        Bed3(refname="chr2", start=3, end=4),
+    ]
+    assert list(record.territory()) == expected
+    assert [len(span) for span in record.territory()] == [1, 1]  # type: ignore[arg-type]
+
+
 def test_bed12_validation() -> None:
     """Test that we can validate improper BED12 records."""
 
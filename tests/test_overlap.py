@@ -1,5 +1,8 @@
+from pathlib import Path
+
 from bedspec import Bed3
 from bedspec import Bed4
+from bedspec import BedReader
 from bedspec.overlap import OverlapDetector
 
 
@@ -58,6 +61,7 @@ def test_we_can_those_enclosing_intervals() -> None:
     assert set(detector.enclosing(Bed3(refname="chr1", start=3, end=9))) == {bed2}
     assert set(detector.enclosing(Bed3(refname="chr1", start=2, end=10))) == set()
     assert set(detector.enclosing(Bed3(refname="chr1", start=1, end=10))) == set()
+    assert set(detector.enclosing(Bed3(refname="chr2", start=3, end=4))) == set()
 
 
 def test_we_can_those_enclosed_by_intervals() -> None:
@@ -121,3 +125,48 @@ def test_we_can_add_to_the_overlap_detector_after_and_before_queries() -> None:
     detector.add(Bed3("chr1", start=5, end=6))
 
     assert detector.overlaps(Bed3("chr1", start=5, end=6))
+
+
+def test_we_can_add_all_features_from_an_iterable_to_the_overlap_detector() -> None:
+    """Test we can add all features from an iterable, sorted or not, to the overlap detector."""
+    beds: list[Bed3] = [
+        Bed3(refname="chr1", start=1, end=2),
+        Bed3(refname="chr1", start=3, end=4),
+        Bed3(refname="chr2", start=1, end=2),
+        Bed3(refname="chr1", start=5, end=6),
+    ]
+    detector: OverlapDetector[Bed3] = OverlapDetector()
+    detector.add_all(bed for bed in beds)
+
+    assert list(detector) == [beds[0], beds[1], beds[3], beds[2]]
+    assert set(detector.overlapping(Bed3("chr1", start=0, end=10))) == {beds[0], beds[1], beds[3]}
+    assert set(detector.overlapping(Bed3("chr2", start=0, end=10))) == {beds[2]}
+
+
+def test_we_can_freeze_the_overlap_detector_and_still_add_features() -> None:
+    """Test we can index the overlap detector ahead of queries and still add features after."""
+    bed1 = Bed3(refname="chr1", start=2, end=5)
+    bed2 = Bed3(refname="chr1", start=5, end=6)
+    detector: OverlapDetector[Bed3] = OverlapDetector([bed1])
+    detector.freeze()
+
+    assert detector.overlaps(Bed3("chr1", start=4, end=5))
+    assert not detector.overlaps(Bed3("chr1", start=5, end=6))
+
+    detector.add(bed2)
+
+    assert set(detector.overlapping(Bed3("chr1", start=4, end=6))) == {bed1, bed2}
+
+
+def test_we_can_build_the_overlap_detector_from_a_bed_reader(tmp_path: Path) -> None:
+    """Test we can stream features from a BED reader straight into the overlap detector."""
+    (tmp_path / "test.bed").write_text("chr1\t1\t4\nchr1\t5\t9\nchr2\t1\t2\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3) as reader:
+        detector: OverlapDetector[Bed3] = OverlapDetector(reader)
+
+    assert len(list(detector)) == 3
+    assert set(detector.overlapping(Bed3("chr1", start=3, end=6))) == {
+        Bed3("chr1", start=1, end=4),
+        Bed3("chr1", start=5, end=9),
+    }
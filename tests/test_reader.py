@@ -1,14 +1,33 @@
+import gzip
+import os
+import struct
+import threading
+import zlib
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
+from typing import Any
+from typing import ClassVar
+
+import pytest
+from typing_extensions import Self
 
 from bedspec import Bed3
 from bedspec import Bed4
 from bedspec import Bed5
+from bedspec import Bed6
 from bedspec import Bed12
 from bedspec import BedColor
+from bedspec import BedGraph
+from bedspec import BedPE
 from bedspec import BedReader
 from bedspec import BedStrand
 from bedspec import BedWriter
+from bedspec import SimpleBed
 from bedspec._bedspec import MISSING_FIELD
+from bedspec._io import GZIP
+from bedspec._io import ZLIB
+from bedspec._io import _optional_module
 
 
 def test_bed_reader_can_read_bed_records_from_a_path(tmp_path: Path) -> None:
@@ -28,6 +47,128 @@ def test_bed_reader_can_read_bed_records_from_a_path(tmp_path: Path) -> None:
     assert list(reader) == [bed]
 
 
+def test_bed_reader_can_read_gzip_compressed_bed_records_from_a_path(tmp_path: Path) -> None:
+    """Test that the BED reader decompresses gzip files regardless of their file suffix."""
+    bed: Bed3 = Bed3(refname="chr1", start=1, end=2)
+    (tmp_path / "test.bed.gz").write_bytes(gzip.compress(b"chr1\t1\t2\n"))
+    (tmp_path / "test.bed").write_bytes(gzip.compress(b"chr1\t1\t2\n"))
+
+    with BedReader.from_path(tmp_path / "test.bed.gz", Bed3) as reader:
+        assert list(reader) == [bed]
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3) as reader:
+        assert list(reader) == [bed]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_bed_reader_can_read_bed_records_from_a_named_pipe(tmp_path: Path, compress: bool) -> None:
+    """Test that the BED reader detects compression without opening a named pipe twice."""
+    data: bytes = gzip.compress(b"chr1\t1\t2\n") if compress else b"chr1\t1\t2\n"
+    os.mkfifo(tmp_path / "test.bed")
+    writer = threading.Thread(target=(tmp_path / "test.bed").write_bytes, args=(data,))
+    writer.start()
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3) as reader:
+        assert list(reader) == [Bed3(refname="chr1", start=1, end=2)]
+
+    writer.join()
+
+
+def test_bed_reader_can_read_bgzf_compressed_bed_records_from_a_path(tmp_path: Path) -> None:
+    """Test that the BED reader decompresses BGZF files which are a series of gzip members."""
+    bed1: Bed3 = Bed3(refname="chr1", start=1, end=2)
+    bed2: Bed3 = Bed3(refname="chr2", start=3, end=4)
+    members: bytes = gzip.compress(b"chr1\t1\t2\n") + gzip.compress(b"chr2\t3\t4\n")
+    (tmp_path / "test.bed.bgz").write_bytes(members)
+
+    with BedReader.from_path(tmp_path / "test.bed.bgz", Bed3) as reader:
+        assert list(reader) == [bed1, bed2]
+
+
+def write_bgzf(path: Path, blocks: list[bytes]) -> None:
+    """Write each chunk of data as its own BGZF block, followed by the BGZF end-of-file block."""
+    with path.open("wb") as handle:
+        for data in [*blocks, b""]:
+            compressor = zlib.compressobj(wbits=-15)
+            deflated: bytes = compressor.compress(data) + compressor.flush()
+            header: bytes = b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC\x02\x00"
+            block_size: int = len(header) + 2 + len(deflated) + 8
+            trailer: bytes = struct.pack("<II", zlib.crc32(data), len(data))
+            _ = handle.write(header + struct.pack("<H", block_size - 1) + deflated + trailer)
+
+
+@pytest.mark.parametrize("threads", [1, 2, 4])
+def test_bed_reader_can_decompress_bgzf_blocks_on_many_threads(
+    tmp_path: Path, threads: int
+) -> None:
+    """Test that the BED reader can decompress BGZF blocks in parallel and keep records in order."""
+    beds: list[Bed3] = [Bed3(refname="chr1", start=start, end=start + 1) for start in range(500)]
+    lines: bytes = b"".join(f"chr1\t{bed.start}\t{bed.end}\n".encode() for bed in beds)
+    write_bgzf(
+        tmp_path / "test.bed.gz",
+        [lines[offset : offset + 100] for offset in range(0, len(lines), 100)],
+    )
+
+    with BedReader.from_path(tmp_path / "test.bed.gz", Bed3, threads=threads) as reader:
+        assert list(reader) == beds
+
+
+def test_bed_reader_raises_an_error_for_a_corrupt_bgzf_block(tmp_path: Path) -> None:
+    """Test that the BED reader raises an error for a corrupt BGZF file read on many threads."""
+    write_bgzf(tmp_path / "test.bed.gz", [b"chr1\t1\t2\n"])
+    (tmp_path / "test.bed.gz").write_bytes((tmp_path / "test.bed.gz").read_bytes() + b"garbage")
+
+    with BedReader.from_path(tmp_path / "test.bed.gz", Bed3, threads=2) as reader:
+        with pytest.raises(ValueError, match="Invalid BGZF block header at offset"):
+            _ = list(reader)
+
+
+def test_bed_reader_yields_the_records_before_a_corrupt_bgzf_block(tmp_path: Path) -> None:
+    """Test that the BED reader yields every record decompressed before a corrupt BGZF block."""
+    beds: list[Bed3] = [Bed3(refname="chr1", start=start, end=start + 1) for start in range(20)]
+    write_bgzf(
+        tmp_path / "test.bed.gz", [f"chr1\t{bed.start}\t{bed.end}\n".encode() for bed in beds]
+    )
+    (tmp_path / "test.bed.gz").write_bytes(
+        (tmp_path / "test.bed.gz").read_bytes()[:-28] + b"garbage"  # replace the EOF block
+    )
+    records: list[Bed3] = []
+
+    with BedReader.from_path(tmp_path / "test.bed.gz", Bed3, threads=2) as reader:
+        with pytest.raises(ValueError, match="Invalid BGZF block header at offset"):
+            for record in reader:
+                records.append(record)
+
+    assert records == beds
+
+
+def test_bed_reader_can_read_bgzf_records_from_a_named_pipe_on_many_threads(
+    tmp_path: Path,
+) -> None:
+    """Test that the BED reader detects BGZF compression without opening a named pipe twice."""
+    write_bgzf(tmp_path / "test.bed.gz", [b"chr1\t1\t2\n", b"chr2\t3\t4\n"])
+    os.mkfifo(tmp_path / "test.bed")
+    data: bytes = (tmp_path / "test.bed.gz").read_bytes()
+    writer = threading.Thread(target=(tmp_path / "test.bed").write_bytes, args=(data,))
+    writer.start()
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3, threads=2) as reader:
+        assert list(reader) == [
+            Bed3(refname="chr1", start=1, end=2),
+            Bed3(refname="chr2", start=3, end=4),
+        ]
+
+    writer.join()
+
+
+def test_bed_reader_raises_an_error_for_too_few_threads(tmp_path: Path) -> None:
+    """Test that the BED reader requires at least one thread to read a file with."""
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\n")
+
+    with pytest.raises(ValueError, match="The number of threads must be at least 1 but found: 0"):
+        _ = BedReader.from_path(tmp_path / "test.bed", Bed3, threads=0)
+
+
 def test_bed_reader_can_read_bed_records_with_comments(tmp_path: Path) -> None:
     """Test that the BED reader can read BED records with comments."""
     bed: Bed3 = Bed3(refname="chr1", start=1, end=2)
@@ -46,6 +187,14 @@ def test_bed_reader_can_read_bed_records_with_comments(tmp_path: Path) -> None:
         assert list(BedReader(handle, Bed3)) == [bed]
 
 
+def test_bed_reader_can_skip_lines_with_custom_comment_prefixes(tmp_path: Path) -> None:
+    """Test that the BED reader skips blank lines and lines with any custom comment prefix."""
+    (tmp_path / "test.bed").write_text("@comment\n\n  \n %comment\r\n\r\nchr1\t1\t2\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3, comment_prefixes={"@", "%"}) as reader:
+        assert list(reader) == [Bed3(refname="chr1", start=1, end=2)]
+
+
 def test_bed_reader_can_read_optional_string_types(tmp_path: Path) -> None:
     """Test that the BED reader can read BED records with optional string types."""
     bed: Bed4 = Bed4(refname="chr1", start=1, end=2, name=None)
@@ -101,3 +250,424 @@ def test_we_can_roundtrip_a_bed_record_with_complex_types(tmp_path: Path) -> Non
 
     with BedReader.from_path(tmp_path / "test.bed", Bed12) as reader:
         assert list(reader) == [bed12]
+
+
+def test_bed_reader_can_read_all_bed_types_with_missing_fields(tmp_path: Path) -> None:
+    """Test that the BED reader decodes missing fields, strands, and unset colors."""
+    bed6: Bed6 = Bed6(refname="chr1", start=1, end=2, name=None, score=None, strand=None)
+    graph: BedGraph = BedGraph(refname="chr1", start=1, end=2, value=0.5)
+
+    (tmp_path / "test6.bed").write_text("chr1\t1\t2\t.\t.\t.\n")
+    (tmp_path / "graph.bed").write_text("chr1\t1\t2\t0.5\n")
+    (tmp_path / "test12.bed").write_text("chr1\t2\t10\tbed12\t2\t-\t3\t4\t0\t1\t8,\t0,\n")
+
+    with BedReader.from_path(tmp_path / "test6.bed", Bed6) as reader:
+        assert list(reader) == [bed6]
+
+    with BedReader.from_path(tmp_path / "graph.bed", BedGraph) as reader:
+        assert list(reader) == [graph]
+
+    with BedReader.from_path(tmp_path / "test12.bed", Bed12) as reader:
+        (bed12,) = list(reader)
+
+    assert bed12.strand is BedStrand.Negative
+    assert bed12.item_rgb is None
+    assert bed12.block_sizes == [8]
+    assert bed12.block_starts == [0]
+
+
+@pytest.mark.parametrize("item", ["1_0", "+1", "١"])
+def test_bed_reader_rejects_integers_that_are_not_plain_digits(tmp_path: Path, item: str) -> None:
+    """Test that the BED reader rejects integers with the extra syntax that `int()` accepts."""
+
+    @dataclass
+    class Bed3PlusSizes(SimpleBed):
+        refname: str
+        start: int
+        end: int
+        sizes: list[int]
+
+    (tmp_path / "test.bed").write_text(f"chr1\t1\t2\t1,{item}\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3PlusSizes) as reader:
+        with pytest.raises(ValueError, match="Could not parse line 1 into a Bed3PlusSizes"):
+            list(reader)
+
+
+@pytest.mark.parametrize("item", ["1_0.5", "+1.5", "nan", "inf", "-Infinity", ".5", "5."])
+def test_bed_reader_rejects_floats_that_are_not_plain_numbers(tmp_path: Path, item: str) -> None:
+    """Test that the BED reader rejects floats with the extra syntax that `float()` accepts."""
+
+    @dataclass
+    class Bed3PlusValues(SimpleBed):
+        refname: str
+        start: int
+        end: int
+        values: list[float]
+
+    (tmp_path / "test.bed").write_text(f"chr1\t1\t2\t0.5,{item}\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3PlusValues) as reader:
+        with pytest.raises(ValueError, match="Could not parse line 1 into a Bed3PlusValues"):
+            list(reader)
+
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\t0.5,-1.5e3,2E-2,7\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3PlusValues) as reader:
+        assert [record.values for record in reader] == [[0.5, -1500.0, 0.02, 7.0]]
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        "chr1\t1_0\t20\n",
+        "chr1\t+1\t20\n",
+        "chr1\t١\t20\n",
+        "chr1\t1\t2\tname\t1_0\t+\n",
+        "chr1\t1\t2\tnan\n",
+        "chr1\t1\t2\t-inf\n",
+        "chr1\t1\t2\t1_0.5\n",
+        "chr1\t1\t2\t+1.5\n",
+    ],
+)
+@pytest.mark.parametrize("read_table", [False, True])
+def test_bed_reader_rejects_number_syntax_that_int_and_float_accept(
+    tmp_path: Path, contents: str, read_table: bool
+) -> None:
+    """Test that the BED reader rejects numbers with underscores, signs, or non-finite values."""
+    record_types: dict[int, type[SimpleBed]] = {3: Bed3, 4: BedGraph, 6: Bed6}
+    record_type: type[SimpleBed] = record_types[contents.count("\t") + 1]
+    (tmp_path / "test.bed").write_text(contents)
+
+    with BedReader.from_path(tmp_path / "test.bed", record_type) as reader:
+        with pytest.raises(ValueError, match="Could not parse line 1"):
+            _ = reader.read_table() if read_table else list(reader)
+
+
+@pytest.mark.parametrize("read_table", [False, True])
+def test_bed_reader_can_read_negative_and_exponent_numbers(
+    tmp_path: Path, read_table: bool
+) -> None:
+    """Test that the BED reader decodes numbers whose syntax is checked in full."""
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\t-1.5e+3\nchr1\t1\t2\t2E-2\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", BedGraph) as reader:
+        records = list(reader.read_table() if read_table else reader)
+
+    assert [record.value for record in records] == [-1500.0, 0.02]
+
+
+@pytest.mark.parametrize("read_table", [False, True])
+def test_bed_reader_decodes_missing_optional_fields_like_the_generic_path(
+    tmp_path: Path, read_table: bool
+) -> None:
+    """Test that the BED reader decodes `.`, empty, and `null` optional fields as `None`."""
+    (tmp_path / "test.bed").write_text(
+        "chr1\t1\t2\tnull\tnull\t+\nchr1\t1\t2\t\t\t-\nchr1\t1\t2\t.\t.\t.\n"
+    )
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed6) as reader:
+        generic: list[Bed6] = list(super(BedReader, reader).__iter__())
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed6) as reader:
+        records: list[Bed6] = list(reader.read_table() if read_table else reader)
+
+    assert records == generic
+    assert [(record.name, record.score) for record in records] == [(None, None)] * 3
+
+
+def test_bed_reader_raises_a_helpful_error_when_a_field_cannot_be_decoded(tmp_path: Path) -> None:
+    """Test that the BED reader reports the line it could not decode."""
+    (tmp_path / "test.bed").write_text("# comment\nchr1\tone\t2\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3) as reader:
+        with pytest.raises(ValueError, match="Could not parse line 2 into a Bed3"):
+            list(reader)
+
+
+def test_bed_reader_falls_back_to_generic_decoding_for_custom_field_types(tmp_path: Path) -> None:
+    """Test that the BED reader can decode custom BED fields the fast path does not support."""
+
+    @dataclass
+    class Bed3PlusExtra(SimpleBed):
+        refname: str
+        start: int
+        end: int
+        extra: dict[str, int]
+
+    (tmp_path / "test.bed").write_text('chr1\t1\t2\t{"a": 1}\n')
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3PlusExtra) as reader:
+        assert list(reader) == [Bed3PlusExtra(refname="chr1", start=1, end=2, extra={"a": 1})]
+
+
+def test_bed_reader_can_read_booleans_and_string_enums(tmp_path: Path) -> None:
+    """Test that the BED reader decodes booleans and string enums without the generic path."""
+
+    class Kind(Enum):
+        Gene = "gene"
+        Exon = "exon"
+
+    @dataclass
+    class Bed3PlusKind(SimpleBed):
+        refname: str
+        start: int
+        end: int
+        flag: bool
+        kind: Kind | None
+
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\ttrue\tgene\nchr1\t1\t2\tfalse\t.\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3PlusKind) as reader:
+        assert list(reader) == [
+            Bed3PlusKind(refname="chr1", start=1, end=2, flag=True, kind=Kind.Gene),
+            Bed3PlusKind(refname="chr1", start=1, end=2, flag=False, kind=None),
+        ]
+
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\ttrue\tintron\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3PlusKind) as reader:
+        with pytest.raises(ValueError, match="'intron' is not a valid Kind"):
+            list(reader)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [("true", True), ("True", True), ("TRUE", True), ("1", True), ("False", False), ("0", False)],
+)
+def test_bed_reader_can_read_booleans_in_any_case_or_as_numbers(
+    tmp_path: Path, value: str, expected: bool
+) -> None:
+    """Test that the BED reader decodes the same boolean spellings as the generic path."""
+
+    @dataclass
+    class Bed3PlusFlag(SimpleBed):
+        refname: str
+        start: int
+        end: int
+        flag: bool
+
+    (tmp_path / "test.bed").write_text(f"chr1\t1\t2\t{value}\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3PlusFlag) as reader:
+        assert list(reader) == [Bed3PlusFlag(refname="chr1", start=1, end=2, flag=expected)]
+
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\tYes\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3PlusFlag) as reader:
+        with pytest.raises(ValueError, match="'Yes' is not a valid bool"):
+            list(reader)
+
+
+def test_bed_reader_decodes_quoted_fields_and_integral_floats_like_the_generic_path(
+    tmp_path: Path,
+) -> None:
+    """Test that the BED reader strips single quotes and converts integral floats to integers."""
+    expected: Bed6 = Bed6(
+        refname="chr1", start=1, end=2, name="gene one", score=1, strand=BedStrand.Positive
+    )
+    fast: Bed6 = Bed6(refname="chr1", start=3, end=4, name="it's", score=2, strand=None)
+    (tmp_path / "test.bed").write_text(
+        "chr1\t1\t2\t'gene one'\t1.0\t+\nchr1\t1\t2\t'gene one'\t1\t+\nchr1\t3\t4\tit's\t2\t.\n"
+    )
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed6) as reader:
+        assert list(reader) == [expected, expected, fast]
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed6) as reader:
+        assert list(reader.read_table()) == [expected, expected, fast]
+
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\t'gene one'\t1\t+\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed6) as reader:
+        assert list(reader.read_table()) == [expected]
+
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\tgene\t1.5\t+\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed6) as reader:
+        with pytest.raises(ValueError, match="invalid literal for int\\(\\) with base 10: '1.5'"):
+            list(reader)
+
+
+def test_bed_reader_can_read_custom_bed_types_with_string_annotations(tmp_path: Path) -> None:
+    """Test that the BED reader resolves string annotations like those of postponed evaluation."""
+
+    @dataclass(slots=True, unsafe_hash=True)
+    class Bed3PlusStrand(SimpleBed):
+        refname: "str"
+        start: "int"
+        end: "int"
+        strand: "BedStrand | None"
+
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\t+\nchr1\t1\t2\t.\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3PlusStrand) as reader:
+        assert list(reader) == [
+            Bed3PlusStrand(refname="chr1", start=1, end=2, strand=BedStrand.Positive),
+            Bed3PlusStrand(refname="chr1", start=1, end=2, strand=None),
+        ]
+
+
+def test_bed_reader_requires_custom_bed_types_to_be_dataclasses(tmp_path: Path) -> None:
+    """Test that the BED reader rejects a custom BED subclass that is not itself a dataclass."""
+
+    class Bed3PlusOne(Bed3):
+        my_custom_field: float | None
+
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\t0.1\n")
+
+    with open(tmp_path / "test.bed", "r") as handle:
+        with pytest.raises(TypeError, match="You must annotate custom BED class definitions"):
+            BedReader(handle, Bed3PlusOne)
+
+
+def test_bed_reader_shares_reference_sequence_names_across_records(tmp_path: Path) -> None:
+    """Test that decoded records share one string object per reference sequence name."""
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\tchr1\t3\t4\t.\t.\t+\t-\n" * 2)
+
+    with BedReader.from_path(tmp_path / "test.bed", BedPE) as reader:
+        first, second = list(reader)
+
+    assert first.refname1 is second.refname1
+    assert first.refname1 is second.refname2
+
+
+def test_bed_reader_raises_a_helpful_error_when_a_line_has_the_wrong_number_of_fields(
+    tmp_path: Path,
+) -> None:
+    """Test that the BED reader reports lines with too few or too many fields."""
+    (tmp_path / "short.bed").write_text("chr1\t1\n")
+    (tmp_path / "long.bed").write_text("chr1\t1\t2\tname\n")
+
+    with BedReader.from_path(tmp_path / "short.bed", Bed3) as reader:
+        with pytest.raises(ValueError, match="Expected 3 fields for a Bed3 but found 2 on line 1"):
+            list(reader)
+
+    with BedReader.from_path(tmp_path / "long.bed", Bed3) as reader:
+        with pytest.raises(ValueError, match="Expected 3 fields for a Bed3 but found 4 on line 1"):
+            list(reader)
+
+
+@pytest.mark.parametrize("strand,message", [("*", "'\\*'"), ("", "''")])
+def test_bed_reader_raises_a_helpful_error_for_an_invalid_strand(
+    tmp_path: Path, strand: str, message: str
+) -> None:
+    """Test that the BED reader reports the line with an invalid or empty strand."""
+    (tmp_path / "test.bed").write_text(f"chr1\t1\t2\tfoo\t3\t{strand}\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed6) as reader:
+        with pytest.raises(ValueError, match=f"{message} is not a valid BedStrand"):
+            list(reader)
+
+
+def test_bed_reader_raises_the_validation_error_of_an_invalid_bed_record(tmp_path: Path) -> None:
+    """Test that the BED reader raises the validation error of a record with well-formed fields."""
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\nchr1\t5\t2\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3) as reader:
+        with pytest.raises(ValueError, match="start must be greater than 0 and less than end!"):
+            _ = list(reader)
+
+
+def test_bed_reader_can_pipe_lines_to_a_bed_writer(tmp_path: Path) -> None:
+    """Test that the BED reader can copy its lines, without comments, to a BED writer."""
+    (tmp_path / "test.bed").write_text("# comment\nchr1\t1\t2\n\nchr2\t3\t4\nchr1\t5\t6")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3) as reader:
+        with BedWriter.from_path(tmp_path / "all.bed", Bed3) as writer:
+            reader.pipe(writer)
+
+    assert (tmp_path / "all.bed").read_text() == "chr1\t1\t2\nchr2\t3\t4\nchr1\t5\t6\n"
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3) as reader:
+        with BedWriter.from_path(tmp_path / "chr1.bed", Bed3) as writer:
+            reader.pipe(writer, predicate=lambda line: line.startswith("chr1\t"))
+
+    assert (tmp_path / "chr1.bed").read_text() == "chr1\t1\t2\nchr1\t5\t6\n"
+
+
+def test_bed_reader_and_writer_accept_a_buffer_size(tmp_path: Path) -> None:
+    """Test that BED files can be read and written through buffers of any size."""
+    records: list[Bed3] = [Bed3(refname="chr1", start=start, end=start + 1) for start in range(100)]
+
+    with BedWriter.from_path(tmp_path / "test.bed", Bed3, buffer_size=16) as writer:
+        writer.write_all(records)
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3, buffer_size=16) as reader:
+        assert list(reader) == records
+
+
+def test_optional_modules_fall_back_to_the_module_they_replace() -> None:
+    """Test that an optional module that is not installed is replaced by its fallback module."""
+    assert _optional_module("bedspec.not_a_module", gzip) is gzip
+    assert _optional_module("zlib", gzip) is zlib
+
+
+@pytest.mark.parametrize("threads", [1, 2])
+def test_bed_reader_decompresses_with_isal_when_it_is_installed(
+    tmp_path: Path, threads: int
+) -> None:
+    """Test that the BED reader decompresses gzip and BGZF files with `isal` from the gzip extra."""
+    _ = pytest.importorskip("isal")
+    beds: list[Bed3] = [Bed3(refname="chr1", start=1, end=2), Bed3(refname="chr2", start=3, end=4)]
+    (tmp_path / "test.bed.gz").write_bytes(gzip.compress(b"chr1\t1\t2\nchr2\t3\t4\n"))
+    write_bgzf(tmp_path / "test.bed.bgz", [b"chr1\t1\t2\n", b"chr2\t3\t4\n"])
+
+    assert (GZIP.__name__, ZLIB.__name__) == ("isal.igzip", "isal.isal_zlib")
+
+    for path in (tmp_path / "test.bed.gz", tmp_path / "test.bed.bgz"):
+        with BedReader.from_path(path, Bed3, threads=threads) as reader:
+            assert list(reader) == beds
+
+
+def test_bed_reader_calls_custom_constructors_of_bed_types(tmp_path: Path) -> None:
+    """Test that the BED reader builds records by calling BED types that define `__new__`."""
+
+    @dataclass(slots=True, unsafe_hash=True)
+    class CountedBed3(SimpleBed):
+        count: ClassVar[int] = 0
+
+        def __new__(cls, *args: Any, **kwargs: Any) -> Self:  # noqa: ARG004
+            cls.count += 1
+            return object.__new__(cls)
+
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\nchr1\t3\t4\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", CountedBed3) as reader:
+        assert list(reader) == [
+            CountedBed3(refname="chr1", start=1, end=2),
+            CountedBed3(refname="chr1", start=3, end=4),
+        ]
+
+    assert CountedBed3.count == 4
+
+
+def test_bed_reader_shares_equal_colors_between_records(tmp_path: Path) -> None:
+    """Test that the BED reader decodes equal color strings into one shared, immutable color."""
+    line: str = "chr1\t1\t2\tname\t3\t+\t1\t2\t101,2,32\t1\t1,\t0,\n"
+    (tmp_path / "test.bed").write_text(line * 2)
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed12) as reader:
+        first, second = list(reader)
+
+    assert first.item_rgb == BedColor(101, 2, 32)
+    assert first.item_rgb is second.item_rgb
+
+
+def test_bed_reader_can_decode_colors_through_the_generic_path(tmp_path: Path) -> None:
+    """Test that BED colors decode on the generic path, next to fields the fast path rejects."""
+
+    @dataclass
+    class Bed3PlusColor(SimpleBed):
+        refname: str
+        start: int
+        end: int
+        color: BedColor
+        extra: dict[str, int]
+
+    (tmp_path / "test.bed").write_text('chr1\t1\t2\t2,3,4\t{"a": 1}\n')
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3PlusColor) as reader:
+        assert list(reader) == [
+            Bed3PlusColor(refname="chr1", start=1, end=2, color=BedColor(2, 3, 4), extra={"a": 1})
+        ]
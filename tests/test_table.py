@@ -0,0 +1,170 @@
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+import bedspec._reader
+from bedspec import Bed3
+from bedspec import Bed6
+from bedspec import Bed12
+from bedspec import BedPE
+from bedspec import BedReader
+from bedspec import BedStrand
+from bedspec import BedTable
+from bedspec import SimpleBed
+
+
+def test_bed_reader_can_read_a_bed_table(tmp_path: Path) -> None:
+    """Test that the BED reader can read BED records into columns."""
+    (tmp_path / "test.bed").write_text("# comment\nchr1\t1\t2\tfoo\t3\t+\nchr2\t4\t8\t.\t.\t-\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed6) as reader:
+        table = reader.read_table()
+
+    assert len(table) == 2
+    assert table.record_type is Bed6
+    assert list(table.columns) == ["refname", "start", "end", "name", "score", "strand"]
+    assert table["refname"] == ["chr1", "chr2"]
+    assert table["start"] == array("q", [1, 4])
+    assert table["end"] == array("q", [2, 8])
+    assert table["name"] == ["foo", None]
+    assert table["score"] == [3, None]
+    assert table["strand"] == [BedStrand.Positive, BedStrand.Negative]
+
+
+def test_bed_reader_can_read_a_bed_table_in_many_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the BED reader can read a BED table from chunks, some of which are all comments."""
+    monkeypatch.setattr(bedspec._reader, "TABLE_CHUNK_SIZE", 2)
+    (tmp_path / "test.bed").write_text("# comment\n# comment\nchr1\t1\t2\n\nchr2\t4\t8\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3) as reader:
+        table = reader.read_table()
+
+    assert table["refname"] == ["chr1", "chr2"]
+    assert table["start"] == array("q", [1, 4])
+    assert table["end"] == array("q", [2, 8])
+
+
+def test_bed_reader_can_read_a_bed_table_with_integers_too_large_for_an_array(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the BED reader unpacks an integer column into a list if a value overflows it."""
+    monkeypatch.setattr(bedspec._reader, "TABLE_CHUNK_SIZE", 2)
+    (tmp_path / "test.bed").write_text(f"chr1\t1\t2\nchr1\t3\t4\nchr1\t5\t{2**63}\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3) as reader:
+        table = reader.read_table()
+
+    assert table["start"] == array("q", [1, 3, 5])
+    assert table["end"] == [2, 4, 2**63]
+    assert list(table)[-1] == Bed3(refname="chr1", start=5, end=2**63)
+
+
+@pytest.mark.parametrize(
+    "contents,message",
+    [
+        ("chr1\t1\t2\n# comment\nchr1\t1\n", "Expected 3 fields for a Bed3 but found 2 on line 3"),
+        (
+            "chr1\t1\t2\n# comment\nchr1\t1\t2\t3\n",
+            "Expected 3 fields for a Bed3 but found 4 on line 3",
+        ),
+        ("chr1\t1\n", "Expected 3 fields for a Bed3 but found 2 on line 1"),
+        ("chr1\t1\t2\n# comment\nchr1\tone\t2\n", "Could not parse line 3 into a Bed3"),
+    ],
+)
+def test_bed_reader_raises_a_helpful_error_for_an_invalid_line_in_a_bed_table(
+    tmp_path: Path, contents: str, message: str
+) -> None:
+    """Test that reading a BED table reports the exact line that could not be decoded."""
+    (tmp_path / "test.bed").write_text(contents)
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3) as reader:
+        with pytest.raises(ValueError, match=message):
+            _ = reader.read_table()
+
+
+@pytest.mark.parametrize("name", ["name", "Clint's"])
+def test_bed_reader_validates_every_row_of_a_bed_table(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, name: str
+) -> None:
+    """Test that reading a BED table validates rows decoded by column or line by line alike."""
+    monkeypatch.setattr(bedspec._reader, "TABLE_CHUNK_SIZE", 2)
+    valid: str = f"chr1\t1\t2\t{name}\t3\t+\t1\t2\t0\t1\t1,\t0,\n"
+    invalid: str = f"chr1\t1\t2\t{name}\t3\t+\t1\t2\t0\t2\t1,\t0,\n"
+    (tmp_path / "test.bed").write_text(valid + valid + valid + invalid)
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed12) as reader:
+        with pytest.raises(
+            ValueError, match="Length of block_sizes and block_starts must equal block_count!"
+        ):
+            _ = reader.read_table()
+
+
+def test_bed_table_builds_records_when_iterated(tmp_path: Path) -> None:
+    """Test that a BED table yields BED records when iterated."""
+    (tmp_path / "test.bed").write_text("chr1\t1\t2\nchr2\t4\t8\n")
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3) as reader:
+        table = reader.read_table()
+
+    expected = [Bed3(refname="chr1", start=1, end=2), Bed3(refname="chr2", start=4, end=8)]
+    assert list(table) == expected
+    assert list(table) == expected
+
+
+def test_bed_table_can_hold_custom_bed_types(tmp_path: Path) -> None:
+    """Test that a BED table can hold custom fields decoded both directly and generically."""
+
+    @dataclass
+    class Bed3PlusFlag(SimpleBed):
+        refname: str
+        start: int
+        end: int
+        flag: bool
+        extra: dict[str, int]
+
+    (tmp_path / "test.bed").write_text('chr1\t1\t2\ttrue\t{"a": 1}\n')
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed3PlusFlag) as reader:
+        table = reader.read_table()
+
+    assert table["start"] == array("q", [1])
+    assert table["flag"] == [True]
+    assert table["extra"] == [{"a": 1}]
+
+
+def test_bed_table_validates_coordinates() -> None:
+    """Test that a BED table validates the intervals in its start and end columns."""
+    with pytest.raises(
+        ValueError, match="start must be greater than 0 and less than end! Found start=5"
+    ):
+        BedTable(Bed3, {"refname": ["chr1", "chr1"], "start": [1, 5], "end": [2, 5]})
+
+    with pytest.raises(ValueError, match="start2 must be greater than 0 and less than end2!"):
+        BedTable(
+            BedPE,
+            {
+                "refname1": ["chr1"],
+                "start1": [1],
+                "end1": [2],
+                "refname2": ["chr1"],
+                "start2": [-1],
+                "end2": [2],
+                "name": [None],
+                "score": [None],
+                "strand1": [None],
+                "strand2": [None],
+            },
+        )
+
+
+def test_bed_table_validates_its_columns() -> None:
+    """Test that a BED table requires one column per field, all of the same length."""
+    with pytest.raises(ValueError, match="Columns must be the fields of Bed3"):
+        BedTable(Bed3, {"refname": ["chr1"], "start": [1]})
+
+    with pytest.raises(ValueError, match="All columns must have the same length!"):
+        BedTable(Bed3, {"refname": ["chr1"], "start": [1, 2], "end": [2, 3]})
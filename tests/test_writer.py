@@ -1,7 +1,12 @@
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
+from typing import Any
 
 import pytest
+from typing_extensions import override
 
+import bedspec._writer
 from bedspec import Bed2
 from bedspec import Bed3
 from bedspec import Bed4
@@ -10,8 +15,10 @@ from bedspec import Bed6
 from bedspec import BedGraph
 from bedspec import BedLike
 from bedspec import BedPE
+from bedspec import BedReader
 from bedspec import BedStrand
 from bedspec import BedWriter
+from bedspec import SimpleBed
 
 
 # fmt: off
@@ -150,3 +157,213 @@ def test_bed_writer_can_be_used_as_context_manager(tmp_path: Path) -> None:
 
     expected = "chr1\t1\nchr2\t2\n"
     assert Path(tmp_path / "test.bed").read_text() == expected
+
+
+def test_bed_writer_requires_custom_bed_types_to_be_dataclasses(tmp_path: Path) -> None:
+    """Test that the BED writer rejects a custom BED subclass that is not itself a dataclass."""
+
+    class Bed3PlusOne(Bed3):
+        my_custom_field: float | None
+
+    with open(tmp_path / "test.bed", "w") as handle:
+        with pytest.raises(TypeError, match="You must annotate custom BED class definitions"):
+            BedWriter(handle, Bed3PlusOne)
+
+
+def test_bed_writer_quotes_fields_like_the_generic_path(tmp_path: Path) -> None:
+    """Test that the BED writer quotes fields like the generic path, so they round-trip."""
+    beds: list[Bed4] = [
+        Bed4(refname="chr1", start=1, end=2, name="Clint's feature"),
+        Bed4(refname="chr1", start=1, end=2, name="tab\tseparated"),
+        Bed4(refname="chr1", start=1, end=2, name='a "plain" name'),
+    ]
+
+    with BedWriter.from_path(tmp_path / "test.bed", Bed4) as writer:
+        writer.write(beds[0])
+        writer.write_all(beds[1:])
+
+    assert (tmp_path / "test.bed").read_text() == (
+        "chr1\t1\t2\t'Clint''s feature'\n"
+        "chr1\t1\t2\t'tab\tseparated'\n"
+        'chr1\t1\t2\ta "plain" name\n'
+    )
+
+    with BedReader.from_path(tmp_path / "test.bed", Bed4) as reader:
+        assert list(reader) == beds
+
+
+def test_bed_writer_formats_floats_and_missing_values_like_the_generic_path(
+    tmp_path: Path,
+) -> None:
+    """Test that the BED writer formats floats as JSON and missing values as a period."""
+
+    @dataclass(slots=True, unsafe_hash=True)
+    class Bed3PlusFloat(SimpleBed):
+        refname: str
+        start: int
+        end: int
+        value: float
+        count: int
+
+    with BedWriter.from_path(tmp_path / "test.bed", Bed3PlusFloat) as writer:
+        writer.write(Bed3PlusFloat(refname="chr1", start=1, end=2, value=1e16, count=1))
+        writer.write_all(
+            [
+                Bed3PlusFloat(refname="chr1", start=1, end=2, value=0.00001, count=2),
+                Bed3PlusFloat(refname="chr1", start=1, end=2, value=2, count=3),
+                Bed3PlusFloat(refname="chr1", start=1, end=2, value=0.5, count=None),  # type: ignore[arg-type]
+            ]
+        )
+
+    assert (tmp_path / "test.bed").read_text() == (
+        "chr1\t1\t2\t1e16\t1\nchr1\t1\t2\t0.00001\t2\nchr1\t1\t2\t2\t3\nchr1\t1\t2\t0.5\t.\n"
+    )
+
+
+def test_bed_writer_falls_back_to_generic_encoding_for_custom_field_types(tmp_path: Path) -> None:
+    """Test that the BED writer can write custom field types that are not strings or numbers."""
+
+    @dataclass(slots=True, unsafe_hash=True)
+    class Bed3PlusExtra(SimpleBed):
+        refname: str
+        start: int
+        end: int
+        extra: dict[str, int]
+
+    with BedWriter.from_path(tmp_path / "test.bed", Bed3PlusExtra) as writer:
+        writer.write(Bed3PlusExtra(refname="chr1", start=1, end=2, extra={"a": 1}))
+
+    assert (tmp_path / "test.bed").read_text() == 'chr1\t1\t2\t{"a":1}\n'
+
+
+def test_bed_writer_can_write_booleans_and_string_enums(tmp_path: Path) -> None:
+    """Test that the BED writer formats booleans and string enums like the generic path does."""
+
+    class Kind(Enum):
+        Gene = "gene"
+        Exon = "exon"
+
+    @dataclass(slots=True, unsafe_hash=True)
+    class Bed3PlusKind(SimpleBed):
+        refname: str
+        start: int
+        end: int
+        flag: bool
+        kind: Kind | None
+
+    with BedWriter.from_path(tmp_path / "test.bed", Bed3PlusKind) as writer:
+        writer.write(Bed3PlusKind(refname="chr1", start=1, end=2, flag=True, kind=Kind.Gene))
+        writer.write(Bed3PlusKind(refname="chr1", start=1, end=2, flag=False, kind=None))
+
+    assert (tmp_path / "test.bed").read_text() == "chr1\t1\t2\ttrue\tgene\nchr1\t1\t2\tfalse\t.\n"
+
+
+def test_bed_writer_can_write_values_that_do_not_match_their_field_types(tmp_path: Path) -> None:
+    """Test that the BED writer formats values generically when they do not match their type."""
+    bed: Bed4 = Bed4(refname="chr1", start=1, end=2, name=3)  # type: ignore[arg-type]
+
+    with BedWriter.from_path(tmp_path / "test.bed", Bed4) as writer:
+        writer.write(bed)
+
+    assert (tmp_path / "test.bed").read_text() == "chr1\t1\t2\t3\n"
+
+
+def test_bed_writer_respects_a_custom_encoding_of_fields(tmp_path: Path) -> None:
+    """Test that a BED writer subclass can override how each field is encoded."""
+
+    class ShoutingBedWriter(BedWriter[Bed4]):
+        @override
+        def _encode(self, item: Any) -> Any:
+            return item.upper() if isinstance(item, str) else super()._encode(item)
+
+    with ShoutingBedWriter(open(tmp_path / "test.bed", "w"), Bed4) as writer:
+        writer.write(Bed4(refname="chr1", start=1, end=2, name="foo"))
+
+    assert (tmp_path / "test.bed").read_text() == "CHR1\t1\t2\tFOO\n"
+
+
+def test_bed_writer_can_write_custom_collection_and_optional_field_types(tmp_path: Path) -> None:
+    """Test that the BED writer can write custom field types it has no specialized format for."""
+
+    @dataclass(slots=True, unsafe_hash=True)
+    class Bed3PlusCustom(SimpleBed):
+        refname: str
+        start: int
+        end: int
+        pair: tuple[int, int]
+        flags: list[bool]
+        maybe: bool | None
+
+    with BedWriter.from_path(tmp_path / "test.bed", Bed3PlusCustom) as writer:
+        writer.write(
+            Bed3PlusCustom(
+                refname="chr1", start=1, end=2, pair=(3, 4), flags=[True, False], maybe=None
+            )
+        )
+
+    assert (tmp_path / "test.bed").read_text() == "chr1\t1\t2\t3,4\tTrue,False\t.\n"
+
+
+def test_bed_writer_can_write_lines_verbatim(tmp_path: Path) -> None:
+    """Test that the BED writer can write lines of BED text verbatim and terminate them."""
+    with BedWriter.from_path(tmp_path / "test.bed", Bed3) as writer:
+        writer.write_lines(["chr1\t1\t2\n", "chr2\t3\t4"])
+
+    assert (tmp_path / "test.bed").read_text() == "chr1\t1\t2\nchr2\t3\t4\n"
+
+
+def test_bed_writer_can_write_all_records_in_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the BED writer can write many records, formatted and written in chunks."""
+    monkeypatch.setattr(bedspec._writer, "WRITE_CHUNK_SIZE", 2)
+    beds: list[Bed6] = [
+        Bed6(refname="chr1", start=1, end=2, name="foo", score=3, strand=BedStrand.Positive),
+        Bed6(refname="chr1", start=3, end=4, name=None, score=None, strand=None),
+        Bed6(refname="chr2", start=5, end=6, name=7, score=8, strand=BedStrand.Negative),  # type: ignore[arg-type]
+    ]
+
+    with BedWriter.from_path(tmp_path / "test.bed", Bed6) as writer:
+        writer.write_all(beds)
+
+    assert (tmp_path / "test.bed").read_text() == (
+        "chr1\t1\t2\tfoo\t3\t+\nchr1\t3\t4\t.\t.\t.\nchr2\t5\t6\t7\t8\t-\n"
+    )
+
+
+def test_bed_writer_can_write_all_records_of_a_custom_bed_type(tmp_path: Path) -> None:
+    """Test that the BED writer can write many records of a BED type without a generated format."""
+
+    @dataclass(slots=True, unsafe_hash=True)
+    class Bed3PlusExtra(SimpleBed):
+        refname: str
+        start: int
+        end: int
+        extra: dict[str, int]
+
+    with BedWriter.from_path(tmp_path / "test.bed", Bed3PlusExtra) as writer:
+        writer.write_all([Bed3PlusExtra(refname="chr1", start=1, end=2, extra={"a": 1})])
+
+    assert (tmp_path / "test.bed").read_text() == 'chr1\t1\t2\t{"a":1}\n'
+
+
+def test_bed_writer_write_all_remembers_the_type_it_will_write(tmp_path: Path) -> None:
+    """Test that the BED writer rejects a record of another type when writing many records."""
+    with BedWriter.from_path(tmp_path / "test.bed", Bed3) as writer:
+        with pytest.raises(ValueError, match="Expected Bed3 but found Bed2!"):
+            writer.write_all([Bed3(refname="chr1", start=1, end=2), Bed2(refname="chr1", start=1)])  # type: ignore[list-item]
+
+    assert (tmp_path / "test.bed").read_text() == "chr1\t1\t2\n"
+
+
+def test_bed_writer_can_write_gzip_compressed_bed_files(tmp_path: Path) -> None:
+    """Test that the BED writer compresses files with names that end with `.gz`."""
+    bed: Bed3 = Bed3(refname="chr1", start=1, end=2)
+
+    with BedWriter.from_path(tmp_path / "test.bed.gz", Bed3) as writer:
+        writer.write(bed)
+
+    assert (tmp_path / "test.bed.gz").read_bytes()[:2] == b"\x1f\x8b"
+
+    with BedReader.from_path(tmp_path / "test.bed.gz", Bed3) as reader:
+        assert list(reader) == [bed]